@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import sys
+from typing import TYPE_CHECKING
 
-from PySide6.QtGui import QCloseEvent, QColor, QIcon, QPainter, QPixmap
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QColor, QIcon
 from PySide6.QtWidgets import QApplication, QMenu, QMessageBox, QSystemTrayIcon
 
 from shellshuck.config import ConfigManager
@@ -15,13 +19,35 @@ from shellshuck.models import MountConfig, TunnelConfig
 from shellshuck.resources import get_resources_dir
 from shellshuck.widgets.main_window import MainWindow
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QCloseEvent
+
 logger = logging.getLogger(__name__)
 
+TRAY_UPDATE_DELAY_MS = 50
+
 RESOURCES_DIR = get_resources_dir()
 
 
+@functools.lru_cache(maxsize=1)
+def _resource_names() -> frozenset[str]:
+    """List the resources directory once instead of stat-ing each icon."""
+    try:
+        with os.scandir(RESOURCES_DIR) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
 def _make_circle_icon(color: QColor) -> QIcon:
     """Generate a simple colored circle icon for the system tray."""
+    from PySide6.QtGui import QPainter, QPixmap, QPixmapCache
+
+    cache_key = f"shellshuck-circle-{color.name()}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(cache_key, pixmap):
+        return QIcon(pixmap)
+
     pixmap = QPixmap(64, 64)
     pixmap.fill(QColor(0, 0, 0, 0))
     painter = QPainter(pixmap)
@@ -30,6 +56,7 @@ def _make_circle_icon(color: QColor) -> QIcon:
     painter.setPen(color)
     painter.drawEllipse(4, 4, 56, 56)
     painter.end()
+    QPixmapCache.insert(cache_key, pixmap)
     return QIcon(pixmap)
 
 
@@ -54,12 +81,15 @@ class ShellshuckApp:
         self.qt_app.setQuitOnLastWindowClosed(False)
 
         # Set application window icon
-        logo_path = RESOURCES_DIR / "shellshuck.svg"
-        if logo_path.exists():
-            self.qt_app.setWindowIcon(QIcon(str(logo_path)))
+        if "shellshuck.svg" in _resource_names():
+            self.qt_app.setWindowIcon(QIcon(str(RESOURCES_DIR / "shellshuck.svg")))
 
         self.config_manager = ConfigManager()
         self.config = self.config_manager.load()
+        self._tunnels_by_id: dict[str, TunnelConfig] = {}
+        self._mounts_by_id: dict[str, MountConfig] = {}
+        self._name_cache: dict[str, str] = {}
+        self._rebuild_indexes()
 
         self.tunnel_manager = TunnelManager()
         self.mount_manager = MountManager()
@@ -81,6 +111,13 @@ class ShellshuckApp:
         self._icon_idle = self._load_icon("tray-idle.svg", QColor(158, 158, 158))
 
         self._tray = QSystemTrayIcon(self._icon_idle)
+        self._last_tray_key: str | None = "idle"
+
+        # Collapse bursts of state changes into a single icon update
+        self._tray_coalesce = QTimer(self.qt_app)
+        self._tray_coalesce.setSingleShot(True)
+        self._tray_coalesce.setInterval(TRAY_UPDATE_DELAY_MS)
+        self._tray_coalesce.timeout.connect(self._do_update_tray_icon)
         self._tray.setToolTip("Shellshuck")
 
         menu = QMenu()
@@ -104,22 +141,25 @@ class ShellshuckApp:
         self.main_window.setup_key_requested.connect(self._on_setup_key)
 
         # Wire manager log signals to the log panel
-        log_panel = self.main_window.log_panel
-        self.tunnel_manager.tunnel_log.connect(
-            lambda cid, msg: log_panel.add_log(cid, msg, self._name_for_id(cid))
-        )
-        self.mount_manager.mount_log.connect(
-            lambda cid, msg: log_panel.add_log(cid, msg, self._name_for_id(cid))
-        )
+        self.tunnel_manager.tunnel_log.connect(self._on_manager_log)
+        self.mount_manager.mount_log.connect(self._on_manager_log)
 
         # Update tray icon on state changes
-        self.tunnel_manager.tunnel_state_changed.connect(lambda *_: self._update_tray_icon())
-        self.mount_manager.mount_state_changed.connect(lambda *_: self._update_tray_icon())
+        self.tunnel_manager.tunnel_state_changed.connect(self._on_state_changed)
+        self.mount_manager.mount_state_changed.connect(self._on_state_changed)
 
         # Desktop notifications on errors
         self.tunnel_manager.tunnel_error.connect(self._notify_error)
         self.mount_manager.mount_error.connect(self._notify_error)
 
+    def _on_manager_log(self, config_id: str, message: str) -> None:
+        self.main_window.log_panel.add_log(
+            config_id, message, self._name_cache.get(config_id, config_id[:8])
+        )
+
+    def _on_state_changed(self, config_id: str, state: object) -> None:
+        self._update_tray_icon()
+
     def _autoconnect(self) -> None:
         """Connect tunnels and mounts marked for auto-connect on startup."""
         for t in self.config.tunnels:
@@ -130,16 +170,31 @@ class ShellshuckApp:
                 self.mount_manager.mount(m)
 
     def _save_and_refresh(self) -> None:
+        # The id dicts are authoritative at runtime; lists are rebuilt for saving
+        self.config.tunnels = list(self._tunnels_by_id.values())
+        self.config.mounts = list(self._mounts_by_id.values())
         self.config_manager.save(self.config)
+        self._rebuild_name_cache()
         self.main_window.set_config(self.config)
 
+    def _rebuild_indexes(self) -> None:
+        """Build the id lookup tables from the loaded config lists."""
+        self._tunnels_by_id = {t.id: t for t in self.config.tunnels}
+        self._mounts_by_id = {m.id: m for m in self.config.mounts}
+        self._rebuild_name_cache()
+
+    def _rebuild_name_cache(self) -> None:
+        self._name_cache = {t.id: t.name for t in self._tunnels_by_id.values()} | {
+            m.id: m.name for m in self._mounts_by_id.values()
+        }
+
     def _on_add_tunnel(self) -> None:
         from shellshuck.widgets.tunnel_dialog import TunnelDialog
 
         dialog = TunnelDialog(parent=self.main_window)
         if dialog.run():
             tunnel = dialog.get_config()
-            self.config.tunnels.append(tunnel)
+            self._tunnels_by_id[tunnel.id] = tunnel
             self._save_and_refresh()
 
     def _on_add_mount(self) -> None:
@@ -148,7 +203,7 @@ class ShellshuckApp:
         dialog = MountDialog(parent=self.main_window)
         if dialog.run():
             mount = dialog.get_config()
-            self.config.mounts.append(mount)
+            self._mounts_by_id[mount.id] = mount
             self._save_and_refresh()
 
     def _on_edit_tunnel(self, config_id: str) -> None:
@@ -159,11 +214,7 @@ class ShellshuckApp:
             return
         dialog = TunnelDialog(tunnel=tunnel, parent=self.main_window)
         if dialog.run():
-            updated = dialog.get_config()
-            for i, t in enumerate(self.config.tunnels):
-                if t.id == config_id:
-                    self.config.tunnels[i] = updated
-                    break
+            self._tunnels_by_id[config_id] = dialog.get_config()
             self._save_and_refresh()
 
     def _on_edit_mount(self, config_id: str) -> None:
@@ -174,11 +225,7 @@ class ShellshuckApp:
             return
         dialog = MountDialog(mount=mount, parent=self.main_window)
         if dialog.run():
-            updated = dialog.get_config()
-            for i, m in enumerate(self.config.mounts):
-                if m.id == config_id:
-                    self.config.mounts[i] = updated
-                    break
+            self._mounts_by_id[config_id] = dialog.get_config()
             self._save_and_refresh()
 
     def _on_delete(self, config_id: str, conn_type: str) -> None:
@@ -193,10 +240,10 @@ class ShellshuckApp:
 
         if conn_type == "tunnel":
             self.tunnel_manager.stop(config_id)
-            self.config.tunnels = [t for t in self.config.tunnels if t.id != config_id]
+            self._tunnels_by_id.pop(config_id, None)
         else:
             self.mount_manager.unmount(config_id)
-            self.config.mounts = [m for m in self.config.mounts if m.id != config_id]
+            self._mounts_by_id.pop(config_id, None)
 
         self._save_and_refresh()
 
@@ -227,9 +274,8 @@ class ShellshuckApp:
     @staticmethod
     def _load_icon(svg_name: str, fallback_color: QColor) -> QIcon:
         """Load an SVG icon, falling back to a generated circle."""
-        svg_path = RESOURCES_DIR / svg_name
-        if svg_path.exists():
-            return QIcon(str(svg_path))
+        if svg_name in _resource_names():
+            return QIcon(str(RESOURCES_DIR / svg_name))
         return _make_circle_icon(fallback_color)
 
     def _on_tray_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
@@ -242,22 +288,27 @@ class ShellshuckApp:
         self.main_window.activateWindow()
 
     def _connect_all(self) -> None:
-        for t in self.config.tunnels:
-            self.tunnel_manager.start(t)
-        for m in self.config.mounts:
-            self.mount_manager.mount(m)
+        self.tunnel_manager.start_all(self.config.tunnels)
+        self.mount_manager.mount_all(self.config.mounts)
 
     def _disconnect_all(self) -> None:
         self.tunnel_manager.stop_all()
         self.mount_manager.unmount_all()
 
     def _quit(self) -> None:
+        self.tunnel_manager.shutdown()
+        self.mount_manager.shutdown()
         self.tunnel_manager.stop_all()
         self.mount_manager.unmount_all()
         self._tray.hide()
         self.qt_app.quit()
 
     def _update_tray_icon(self) -> None:
+        """Schedule a tray icon update, coalescing rapid state changes."""
+        if not self._tray_coalesce.isActive():
+            self._tray_coalesce.start()
+
+    def _do_update_tray_icon(self) -> None:
         """Update tray icon based on overall connection health."""
         has_error = False
         has_connected = False
@@ -274,6 +325,11 @@ class ShellshuckApp:
             elif mp.state == MountState.MOUNTED:
                 has_connected = True
 
+        key = "error" if has_error else "ok" if has_connected else "idle"
+        if key == self._last_tray_key:
+            return
+        self._last_tray_key = key
+
         if has_error:
             self._tray.setIcon(self._icon_error)
         elif has_connected:
@@ -296,25 +352,13 @@ class ShellshuckApp:
 
     def _name_for_id(self, config_id: str) -> str:
         """Look up a human-readable name for a config id."""
-        for t in self.config.tunnels:
-            if t.id == config_id:
-                return t.name
-        for m in self.config.mounts:
-            if m.id == config_id:
-                return m.name
-        return config_id[:8]
+        return self._name_cache.get(config_id, config_id[:8])
 
     def _find_tunnel(self, config_id: str) -> TunnelConfig | None:
-        for t in self.config.tunnels:
-            if t.id == config_id:
-                return t
-        return None
+        return self._tunnels_by_id.get(config_id)
 
     def _find_mount(self, config_id: str) -> MountConfig | None:
-        for m in self.config.mounts:
-            if m.id == config_id:
-                return m
-        return None
+        return self._mounts_by_id.get(config_id)
 
     def run(self) -> int:
         if self.config.show_splash:
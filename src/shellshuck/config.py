@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path
+from typing import Any
 
 from shellshuck.models import AppConfig
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "shellshuck"
@@ -19,6 +27,7 @@ class ConfigManager:
 
     def __init__(self, config_path: Path | None = None) -> None:
         self.config_path = config_path or DEFAULT_CONFIG_FILE
+        self._last_saved_digest: bytes | None = None
 
     def load(self) -> AppConfig:
         """Load config from disk. Returns default config if file doesn't exist."""
@@ -27,15 +36,60 @@ class ConfigManager:
             return AppConfig()
 
         try:
-            data = json.loads(self.config_path.read_text(encoding="utf-8"))
-            return AppConfig.from_dict(data)
+            raw = self.config_path.read_bytes()
+            config = AppConfig.from_dict(_loads(raw))
         except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
             logger.error("Failed to parse config at %s: %s", self.config_path, e)
             raise
+        self._last_saved_digest = _digest(raw)
+        return config
 
     def save(self, config: AppConfig) -> None:
-        """Save config to disk, creating parent directories as needed."""
+        """Save config to disk, creating parent directories as needed.
+
+        Writes to a temporary file, fsyncs it and renames it over the target
+        so a crash mid-write never leaves a truncated config behind. Skips the write
+        entirely when the serialized config matches what is already on disk.
+        """
+        data = _dumps(config.to_dict())
+        digest = _digest(data)
+        if digest == self._last_saved_digest and self.config_path.exists():
+            logger.debug("Config unchanged, skipping save")
+            return
+
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        data = json.dumps(config.to_dict(), indent=2)
-        self.config_path.write_text(data + "\n", encoding="utf-8")
+        tmp_path = self.config_path.with_suffix(".json.tmp")
+        _write_synced(tmp_path, data)
+        os.replace(tmp_path, self.config_path)
+        self._last_saved_digest = digest
         logger.info("Config saved to %s", self.config_path)
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: dict[str, object]) -> bytes:
+    """Serialize to indented JSON bytes with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+
+def _write_synced(path: Path, data: bytes) -> None:
+    """Write data with as few syscalls as possible and flush it to disk."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        # Ensure the data is durable before the rename makes it visible
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
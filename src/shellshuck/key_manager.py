@@ -6,18 +6,36 @@ import logging
 import os
 import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import QProcess, QProcessEnvironment
 
+from shellshuck.resources import get_askpass_path
+
 logger = logging.getLogger(__name__)
 
-ASKPASS_SCRIPT = str(Path(__file__).parent / "askpass.py")
+ASKPASS_SCRIPT = get_askpass_path()
+
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9]")
 
 
 def sanitize_name(name: str) -> str:
     """Convert a connection name to a safe filename component."""
-    return re.sub(r"[^a-zA-Z0-9]", "_", name).strip("_") or "key"
+    return _SANITIZE_RE.sub("_", name).strip("_") or "key"
+
+
+@lru_cache(maxsize=1)
+def askpass_env() -> QProcessEnvironment:
+    """Return the environment for ssh processes, with SSH_ASKPASS set.
+
+    Password and passphrase prompts then show a GUI dialog. Built on first use;
+    QProcessEnvironment is implicitly shared, so each launch just bumps a refcount.
+    """
+    env = QProcessEnvironment.systemEnvironment()
+    env.insert("SSH_ASKPASS", ASKPASS_SCRIPT)
+    env.insert("SSH_ASKPASS_REQUIRE", "force")
+    return env
 
 
 def generate_key(name: str, keys_dir: Path) -> Path:
@@ -46,7 +64,8 @@ def generate_key(name: str, keys_dir: Path) -> Path:
             "-f", str(key_path),
             "-C", f"shellshuck:{name}",
         ],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         check=False,
     )
@@ -72,10 +91,7 @@ def deploy_key(
     """
     process = QProcess(parent)  # type: ignore[arg-type]
 
-    env = QProcessEnvironment.systemEnvironment()
-    env.insert("SSH_ASKPASS", ASKPASS_SCRIPT)
-    env.insert("SSH_ASKPASS_REQUIRE", "force")
-    process.setProcessEnvironment(env)
+    process.setProcessEnvironment(askpass_env())
 
     process.setProgram("ssh-copy-id")
     process.setArguments([
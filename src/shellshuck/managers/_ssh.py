@@ -0,0 +1,58 @@
+"""Helpers shared by the tunnel and mount managers."""
+
+from __future__ import annotations
+
+import random
+import re
+import shlex
+import time
+from functools import lru_cache
+
+# Quotes, escapes, or whitespace that shlex does not split on
+_SHELL_QUOTING_RE = re.compile(r"""['"\\]|[^\S \t\r\n]""")
+
+
+@lru_cache(maxsize=64)
+def split_flags(flags: str) -> tuple[str, ...]:
+    """Split a user-supplied flags string into arguments, as shlex would."""
+    if not _SHELL_QUOTING_RE.search(flags):
+        # Nothing for shlex to interpret; plain whitespace splitting is identical
+        return tuple(flags.split())
+    return tuple(shlex.split(flags))
+
+
+def pop_lines(buffer: bytearray, prefix: bytes) -> list[bytes]:
+    """Remove each complete line from buffer and return the non-empty ones, prefixed."""
+    lines: list[bytes] = []
+    while (idx := buffer.find(b"\n")) != -1:
+        # Only a trailing CR needs removing; ssh does not indent its output
+        end = idx - 1 if idx and buffer[idx - 1] == 0x0D else idx
+        line = buffer[:end]
+        del buffer[: idx + 1]
+        if line:
+            lines.append(prefix + line)
+    return lines
+
+
+INITIAL_RETRY_DELAY_MS = 2000
+MAX_RETRY_DELAY_MS = 60000
+BACKOFF_FACTOR = 2
+MAX_RETRIES = 10
+RETRY_JITTER = 0.25  # +/- fraction applied to each delay so retries don't run in lockstep
+STABLE_CONNECTION_S = 30  # uptime after which a failure restarts the backoff sequence
+
+# Base delay (before jitter) for each retry attempt, indexed by retry_count
+BACKOFF_DELAYS_MS = tuple(
+    min(INITIAL_RETRY_DELAY_MS * BACKOFF_FACTOR**attempt, MAX_RETRY_DELAY_MS)
+    for attempt in range(MAX_RETRIES)
+)
+
+
+def retry_delay_ms(retry_count: int) -> int:
+    """Return the jittered delay before the given retry attempt (0-based)."""
+    return int(BACKOFF_DELAYS_MS[retry_count] * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER))
+
+
+def was_stable(connected_at: float | None) -> bool:
+    """Return True if a connection up since connected_at should restart the backoff."""
+    return connected_at is not None and time.monotonic() - connected_at >= STABLE_CONNECTION_S
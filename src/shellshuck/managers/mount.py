@@ -3,26 +3,37 @@
 from __future__ import annotations
 
 import logging
-import shlex
-from enum import Enum, auto
-
-from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, Signal
-
+import os
+import threading
+import time
+from enum import IntEnum, auto
+from functools import partial
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import SIGNAL, QObject, QProcess, QTimer, Signal
+
+from shellshuck.key_manager import askpass_env
+from shellshuck.managers._ssh import (
+    MAX_RETRIES,
+    pop_lines,
+    retry_delay_ms,
+    split_flags,
+    was_stable,
+)
 from shellshuck.models import MountConfig
-from shellshuck.resources import get_askpass_path
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-ASKPASS_SCRIPT = get_askpass_path()
+logger = logging.getLogger(__name__)
 
 HEALTH_CHECK_INTERVAL_MS = 30000
-INITIAL_RETRY_DELAY_MS = 2000
-MAX_RETRY_DELAY_MS = 60000
-BACKOFF_FACTOR = 2
-MAX_RETRIES = 10
+HEALTH_CHECK_TIMEOUT_MS = 5000
+LOG_FLUSH_INTERVAL_MS = 50
+MAX_STDERR_BUFFER_BYTES = 64 * 1024
 
 
-class MountState(Enum):
+class MountState(IntEnum):
     UNMOUNTED = auto()
     MOUNTING = auto()
     MOUNTED = auto()
@@ -41,42 +52,61 @@ class MountProcess:
         self.state = MountState.UNMOUNTED
         self.retry_count: int = 0
         self.retry_timer: QTimer | None = None
+        self.connected_at: float | None = None  # time.monotonic() when sshfs started
         self.health_timer: QTimer | None = None
+        self.health_check_pending: bool = False
         self.intentional_stop: bool = False
-        self.stderr_buffer: str = ""
+        self.stderr_buffer = bytearray()
+        self.pending_log_lines: list[bytes] = []
+        self.log_flush_timer: QTimer | None = None
+
+
+def is_mountpoint(path: str) -> bool:
+    """Return True if path is a live mount point.
+
+    Same test as mountpoint(1): the directory sits on a different device than
+    its parent. A dead FUSE mount raises (ENOTCONN) and counts as not mounted.
+    """
+    try:
+        st = os.stat(path)
+        parent_st = os.stat(os.path.join(path, ".."))
+    except OSError:
+        return False
+    return st.st_dev != parent_st.st_dev or st.st_ino == parent_st.st_ino
+
+
+# Options shared by every sshfs command
+_SSHFS_BASE_ARGS = (
+    "sshfs",
+    "-o",
+    "reconnect",
+    "-o",
+    "ServerAliveInterval=15",
+    "-o",
+    "ServerAliveCountMax=3",
+    "-o",
+    "ConnectTimeout=15",
+    "-o",
+    "ConnectionAttempts=1",
+    "-o",
+    "StrictHostKeyChecking=accept-new",
+)
 
 
 def build_sshfs_command(config: MountConfig) -> list[str]:
     """Build the sshfs command for a mount config."""
-    cmd = [
-        "sshfs",
-        "-o",
-        "reconnect",
-        "-o",
-        "ServerAliveInterval=15",
-        "-o",
-        "ServerAliveCountMax=3",
-        "-o",
-        "ConnectTimeout=15",
-        "-o",
-        "ConnectionAttempts=1",
-        "-o",
-        "StrictHostKeyChecking=accept-new",
+    identity = ("-o", f"IdentityFile={config.identity_file}") if config.identity_file else ()
+    return [
+        *_SSHFS_BASE_ARGS,
         "-o",
         f"port={config.port}",
         "-f",  # foreground — so QProcess can track it
+        *identity,
+        *split_flags(config.sshfs_flags),
+        f"{config.user}@{config.host}:{config.remote_path}",
+        config.local_mount,
     ]
 
-    if config.identity_file:
-        cmd.extend(["-o", f"IdentityFile={config.identity_file}"])
-
-    if config.sshfs_flags:
-        cmd.extend(shlex.split(config.sshfs_flags))
-
-    cmd.append(f"{config.user}@{config.host}:{config.remote_path}")
-    cmd.append(config.local_mount)
-    return cmd
-
 
 class MountManager(QObject):
     """Manages SSHFS mount processes."""
@@ -84,10 +114,13 @@ class MountManager(QObject):
     mount_state_changed = Signal(str, MountState)  # config_id, new_state
     mount_error = Signal(str, str)  # config_id, error_msg
     mount_log = Signal(str, str)  # config_id, log_message
+    _health_checked = Signal(str, bool)  # config_id, healthy (emitted from worker thread)
 
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._mounts: dict[str, MountProcess] = {}
+        self._shutting_down = False
+        self._health_checked.connect(self._on_health_checked)
 
     @property
     def mounts(self) -> dict[str, MountProcess]:
@@ -102,7 +135,6 @@ class MountManager(QObject):
                 return
 
         mp = MountProcess(config)
-        mp.state = MountState.MOUNTING
         self._mounts[config.id] = mp
         self._launch(mp)
 
@@ -128,46 +160,64 @@ class MountManager(QObject):
         # Try graceful fusermount -u first
         self._run_fusermount(mp, lazy=False)
 
+    def mount_all(self, configs: Iterable[MountConfig]) -> None:
+        """Mount every idle config; active or retrying mounts are left alone."""
+        for config in configs:
+            if self.get_state(config.id) in (MountState.UNMOUNTED, MountState.ERROR):
+                self.mount(config)
+
     def unmount_all(self) -> None:
         """Unmount all active mounts."""
         for config_id in list(self._mounts.keys()):
             self.unmount(config_id)
 
+    def shutdown(self) -> None:
+        """Cancel all pending timers and block reconnects ahead of app exit.
+
+        Does not wait for in-flight health checks; their daemon threads may be
+        stuck in stat() on a dead mount and are abandoned at exit.
+        """
+        self._shutting_down = True
+        for mp in self._mounts.values():
+            mp.intentional_stop = True
+            for timer in (mp.retry_timer, mp.health_timer):
+                if timer is not None:
+                    timer.stop()
+            mp.retry_timer = None
+            mp.health_timer = None
+
     def get_state(self, config_id: str) -> MountState:
         mp = self._mounts.get(config_id)
         return mp.state if mp else MountState.UNMOUNTED
 
     def _launch(self, mp: MountProcess) -> None:
         """Launch the sshfs process."""
+        # Not cached on MountProcess: identity_file can change between reconnects
         cmd = build_sshfs_command(mp.config)
         logger.info("Mounting '%s': %s", mp.config.name, " ".join(cmd))
         self.mount_log.emit(mp.config.id, f"Mounting: {' '.join(cmd)}")
         self._set_state(mp, MountState.MOUNTING)
         mp.intentional_stop = False
-        mp.stderr_buffer = ""
+        mp.stderr_buffer = bytearray()
 
         process = QProcess(self)
         mp.process = process
 
-        # Set SSH_ASKPASS so password/passphrase prompts show a GUI dialog
-        env = QProcessEnvironment.systemEnvironment()
-        env.insert("SSH_ASKPASS", ASKPASS_SCRIPT)
-        env.insert("SSH_ASKPASS_REQUIRE", "force")
-        process.setProcessEnvironment(env)
+        process.setProcessEnvironment(askpass_env())
 
         process.setProgram(cmd[0])
         process.setArguments(cmd[1:])
 
-        process.readyReadStandardError.connect(lambda: self._on_stderr(mp))
-        process.started.connect(lambda: self._on_started(mp))
-        process.finished.connect(lambda code, status: self._on_finished(mp, code, status))
+        process.readyReadStandardError.connect(partial(self._on_stderr, mp))
+        process.started.connect(partial(self._on_started, mp))
+        process.finished.connect(partial(self._on_finished, mp))
 
         process.start()
 
     def _on_started(self, mp: MountProcess) -> None:
         """Called when sshfs process starts."""
         self._set_state(mp, MountState.MOUNTED)
-        mp.retry_count = 0
+        mp.connected_at = time.monotonic()
         self.mount_log.emit(mp.config.id, f"Mount '{mp.config.name}' active")
 
         # Start health check timer
@@ -177,19 +227,43 @@ class MountManager(QObject):
         """Accumulate stderr output."""
         if mp.process is None:
             return
-        data = mp.process.readAllStandardError().data().decode(errors="replace")
-        mp.stderr_buffer += data
-        # Log each complete line
-        while "\n" in mp.stderr_buffer:
-            line, mp.stderr_buffer = mp.stderr_buffer.split("\n", 1)
-            line = line.strip()
-            if line:
-                self.mount_log.emit(mp.config.id, f"[sshfs] {line}")
+        raw = mp.process.readAllStandardError().data()
+        if self.receivers(SIGNAL("mount_log(QString,QString)")) == 0:
+            # Nobody is listening for log lines — drop the output undecoded
+            return
+        mp.stderr_buffer += raw
+        # Queue each complete line; a short timer flushes them as one log entry
+        mp.pending_log_lines += pop_lines(mp.stderr_buffer, b"[sshfs] ")
+        # Output without newlines must not grow the buffer forever
+        if len(mp.stderr_buffer) > MAX_STDERR_BUFFER_BYTES:
+            del mp.stderr_buffer[: len(mp.stderr_buffer) // 2]
+
+        if not mp.pending_log_lines:
+            return
+        if mp.log_flush_timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+            timer.timeout.connect(partial(self._flush_log, mp))
+            mp.log_flush_timer = timer
+        if not mp.log_flush_timer.isActive():
+            mp.log_flush_timer.start()
+
+    def _flush_log(self, mp: MountProcess) -> None:
+        """Emit queued stderr lines as a single log message, decoded once."""
+        if not mp.pending_log_lines:
+            return
+        lines, mp.pending_log_lines = mp.pending_log_lines, []
+        self.mount_log.emit(mp.config.id, b"\n".join(lines).decode(errors="replace"))
 
     def _on_finished(
         self, mp: MountProcess, exit_code: int, exit_status: QProcess.ExitStatus
     ) -> None:
         """Handle sshfs process exit."""
+        if mp.log_flush_timer is not None:
+            mp.log_flush_timer.stop()
+        self._flush_log(mp)
+
         if mp.health_timer is not None:
             mp.health_timer.stop()
             mp.health_timer = None
@@ -199,6 +273,10 @@ class MountManager(QObject):
             self.mount_log.emit(mp.config.id, f"Mount '{mp.config.name}' stopped")
             return
 
+        if was_stable(mp.connected_at):
+            mp.retry_count = 0
+        mp.connected_at = None
+
         error_msg = f"sshfs exited with code {exit_code}"
         self.mount_error.emit(mp.config.id, error_msg)
         self.mount_log.emit(mp.config.id, f"Mount '{mp.config.name}' failed: {error_msg}")
@@ -211,10 +289,12 @@ class MountManager(QObject):
         process = QProcess(self)
         process.setProgram("fusermount")
         process.setArguments(args)
-        process.finished.connect(lambda code, status: self._on_fusermount_finished(mp, code, lazy))
+        process.finished.connect(partial(self._on_fusermount_finished, mp, lazy))
         process.start()
 
-    def _on_fusermount_finished(self, mp: MountProcess, exit_code: int, was_lazy: bool) -> None:
+    def _on_fusermount_finished(
+        self, mp: MountProcess, was_lazy: bool, exit_code: int, exit_status: QProcess.ExitStatus
+    ) -> None:
         """Handle fusermount result."""
         if exit_code == 0:
             self._set_state(mp, MountState.UNMOUNTED)
@@ -229,29 +309,59 @@ class MountManager(QObject):
             self.mount_log.emit(mp.config.id, f"Failed to unmount '{mp.config.name}'")
 
     def _start_health_check(self, mp: MountProcess) -> None:
-        """Start periodic health checks using mountpoint -q."""
+        """Start periodic health checks of the mount point."""
         if mp.health_timer is not None:
             mp.health_timer.stop()
 
         timer = QTimer(self)
-        timer.timeout.connect(lambda: self._check_health(mp))
+        timer.timeout.connect(partial(self._check_health, mp))
         timer.start(HEALTH_CHECK_INTERVAL_MS)
         mp.health_timer = timer
 
     def _check_health(self, mp: MountProcess) -> None:
-        """Run mountpoint -q to verify the mount is still alive."""
+        """Verify the mount is still alive on a worker thread.
+
+        stat() on a dead sshfs mount can block, so it never runs on the GUI
+        thread; a check that takes too long counts as unhealthy.
+
+        The worker is a daemon thread rather than a QThreadPool task: Qt waits
+        for pool threads when the pool or application is destroyed, so a stat()
+        hung on a dead mount would stall app exit. Nothing joins these threads,
+        and at most one per mount is in flight.
+        """
         if mp.state not in (MountState.MOUNTED, MountState.UNHEALTHY):
             return
+        if mp.health_check_pending:
+            return
 
-        process = QProcess(self)
-        process.setProgram("mountpoint")
-        process.setArguments(["-q", mp.config.local_mount])
-        process.finished.connect(lambda code, status: self._on_health_check_finished(mp, code))
-        process.start()
+        mp.health_check_pending = True
+        threading.Thread(
+            target=self._run_health_check,
+            args=(mp.config.id, mp.config.local_mount),
+            name=f"health-check-{mp.config.id}",
+            daemon=True,
+        ).start()
+        QTimer.singleShot(HEALTH_CHECK_TIMEOUT_MS, partial(self._on_health_check_timeout, mp))
 
-    def _on_health_check_finished(self, mp: MountProcess, exit_code: int) -> None:
+    def _run_health_check(self, config_id: str, path: str) -> None:
+        """Worker-thread body: stat the mount point and report back."""
+        self._health_checked.emit(config_id, is_mountpoint(path))
+
+    def _on_health_checked(self, config_id: str, healthy: bool) -> None:
+        mp = self._mounts.get(config_id)
+        if mp is None or not mp.health_check_pending:
+            return
+        mp.health_check_pending = False
+        if mp.state in (MountState.MOUNTED, MountState.UNHEALTHY):
+            self._on_health_check_finished(mp, healthy)
+
+    def _on_health_check_timeout(self, mp: MountProcess) -> None:
+        if mp.health_check_pending and mp.state == MountState.MOUNTED:
+            self._on_health_check_finished(mp, False)
+
+    def _on_health_check_finished(self, mp: MountProcess, healthy: bool) -> None:
         """Handle health check result."""
-        if exit_code == 0:
+        if healthy:
             if mp.state == MountState.UNHEALTHY:
                 self._set_state(mp, MountState.MOUNTED)
                 self.mount_log.emit(mp.config.id, f"Mount '{mp.config.name}' recovered")
@@ -262,6 +372,8 @@ class MountManager(QObject):
 
     def _schedule_reconnect(self, mp: MountProcess) -> None:
         """Schedule reconnection with exponential backoff."""
+        if self._shutting_down:
+            return
         if mp.retry_count >= MAX_RETRIES:
             self._set_state(mp, MountState.ERROR)
             self.mount_error.emit(
@@ -274,10 +386,7 @@ class MountManager(QObject):
             )
             return
 
-        delay = min(
-            INITIAL_RETRY_DELAY_MS * (BACKOFF_FACTOR**mp.retry_count),
-            MAX_RETRY_DELAY_MS,
-        )
+        delay = retry_delay_ms(mp.retry_count)
         mp.retry_count += 1
         self._set_state(mp, MountState.RECONNECTING)
         self.mount_log.emit(
@@ -287,8 +396,8 @@ class MountManager(QObject):
 
         timer = QTimer(self)
         timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self._do_reconnect(mp))
-        timer.start(int(delay))
+        timer.timeout.connect(partial(self._do_reconnect, mp))
+        timer.start(delay)
         mp.retry_timer = timer
 
     def _do_reconnect(self, mp: MountProcess) -> None:
@@ -297,5 +406,7 @@ class MountManager(QObject):
         self._launch(mp)
 
     def _set_state(self, mp: MountProcess, state: MountState) -> None:
+        if mp.state == state:
+            return
         mp.state = state
         self.mount_state_changed.emit(mp.config.id, state)
@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 import logging
-import shlex
-from dataclasses import dataclass
-from enum import Enum, auto
-
-from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, Signal
-
+import re
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum, auto
+from functools import partial
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import SIGNAL, QObject, QProcess, QTimer, Signal
+
+from shellshuck.key_manager import askpass_env
+from shellshuck.managers._ssh import (
+    MAX_RETRIES,
+    pop_lines,
+    retry_delay_ms,
+    split_flags,
+    was_stable,
+)
 from shellshuck.models import TunnelConfig
-from shellshuck.resources import get_askpass_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +41,18 @@ SSH_ERROR_PATTERNS: list[tuple[str, str]] = [
     ("broken pipe", "Connection lost (broken pipe)"),
 ]
 
-ASKPASS_SCRIPT = get_askpass_path()
+# All patterns as one case-insensitive alternation; group N maps to message N-1
+_SSH_ERROR_RE = re.compile(
+    "|".join(f"({re.escape(pattern)})" for pattern, _ in SSH_ERROR_PATTERNS),
+    re.IGNORECASE,
+)
+_SSH_ERROR_MESSAGES = tuple(message for _, message in SSH_ERROR_PATTERNS)
 
-INITIAL_RETRY_DELAY_MS = 2000
-MAX_RETRY_DELAY_MS = 60000
-BACKOFF_FACTOR = 2
-MAX_RETRIES = 10
+MAX_STDERR_BUFFER_BYTES = 64 * 1024
+LOG_FLUSH_INTERVAL_MS = 50
 
 
-class TunnelState(Enum):
+class TunnelState(IntEnum):
     DISCONNECTED = auto()
     CONNECTING = auto()
     CONNECTED = auto()
@@ -44,7 +60,7 @@ class TunnelState(Enum):
     ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class TunnelProcess:
     """Tracks a running tunnel's process and reconnect state."""
 
@@ -52,51 +68,63 @@ class TunnelProcess:
     process: QProcess | None = None
     retry_count: int = 0
     retry_timer: QTimer | None = None
+    connected_at: float | None = None  # time.monotonic() when the process started
     state: TunnelState = TunnelState.DISCONNECTED
-    stderr_buffer: str = ""
+    stderr_buffer: bytearray = field(default_factory=bytearray)  # bounded tail, for errors
+    line_buffer: bytearray = field(default_factory=bytearray)  # incomplete log line
+    pending_log_lines: list[bytes] = field(default_factory=list)
+    log_flush_timer: QTimer | None = None
     intentional_stop: bool = False
 
 
-def parse_ssh_error(stderr: str) -> str:
+def parse_ssh_error(stderr: str | bytes | bytearray) -> str:
     """Extract a human-readable error from SSH stderr output."""
-    stderr_lower = stderr.lower()
-    for pattern, message in SSH_ERROR_PATTERNS:
-        if pattern.lower() in stderr_lower:
-            return message
-    # Return the last non-empty line as fallback
-    lines = [line.strip() for line in stderr.strip().splitlines() if line.strip()]
-    return lines[-1] if lines else "Unknown SSH error"
+    if not isinstance(stderr, str):
+        stderr = stderr.decode(errors="replace")
+    # Earlier entries in SSH_ERROR_PATTERNS take priority over later ones
+    groups = [m.lastindex for m in _SSH_ERROR_RE.finditer(stderr) if m.lastindex]
+    if groups:
+        return _SSH_ERROR_MESSAGES[min(groups) - 1]
+    # Return the last non-empty line as fallback, scanning back from the tail
+    end = len(stderr)
+    while end > 0:
+        nl = stderr.rfind("\n", 0, end)
+        line = stderr[nl + 1 : end].strip()
+        if line:
+            return line
+        end = max(nl, 0)
+    return "Unknown SSH error"
+
+
+# Arguments shared by every tunnel command
+_SSH_BASE_ARGS = (
+    "ssh",
+    "-N",  # no remote command
+    "-o",
+    "ExitOnForwardFailure=yes",
+    "-o",
+    "ServerAliveInterval=15",
+    "-o",
+    "ServerAliveCountMax=3",
+    "-o",
+    "StrictHostKeyChecking=accept-new",
+)
 
 
 def build_ssh_command(config: TunnelConfig) -> list[str]:
     """Build the ssh command line for a tunnel config."""
-    cmd = [
-        "ssh",
-        "-N",  # no remote command
-        "-o",
-        "ExitOnForwardFailure=yes",
-        "-o",
-        "ServerAliveInterval=15",
-        "-o",
-        "ServerAliveCountMax=3",
-        "-o",
-        "StrictHostKeyChecking=accept-new",
+    # One list display so the list is sized once rather than grown per argument
+    identity = ("-i", config.identity_file) if config.identity_file else ()
+    return [
+        *_SSH_BASE_ARGS,
         "-p",
         str(config.port),
+        *(arg for rule in config.forward_rules for arg in ("-L", rule.to_ssh_arg())),
+        *identity,
+        *split_flags(config.extra_ssh_flags),
+        f"{config.user}@{config.host}",
     ]
 
-    for rule in config.forward_rules:
-        cmd.extend(["-L", rule.to_ssh_arg()])
-
-    if config.identity_file:
-        cmd.extend(["-i", config.identity_file])
-
-    if config.extra_ssh_flags:
-        cmd.extend(shlex.split(config.extra_ssh_flags))
-
-    cmd.append(f"{config.user}@{config.host}")
-    return cmd
-
 
 class TunnelManager(QObject):
     """Manages SSH tunnel processes."""
@@ -108,6 +136,7 @@ class TunnelManager(QObject):
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._tunnels: dict[str, TunnelProcess] = {}
+        self._shutting_down = False
 
     @property
     def tunnels(self) -> dict[str, TunnelProcess]:
@@ -121,8 +150,9 @@ class TunnelManager(QObject):
                 logger.warning("Tunnel %s already running", config.name)
                 return
 
-        tp = TunnelProcess(config=config, state=TunnelState.CONNECTING)
+        tp = TunnelProcess(config=config)
         self._tunnels[config.id] = tp
+        self._set_state(tp, TunnelState.CONNECTING)
         self._launch(tp)
 
     def stop(self, config_id: str) -> None:
@@ -145,68 +175,111 @@ class TunnelManager(QObject):
         self._set_state(tp, TunnelState.DISCONNECTED)
         self.tunnel_log.emit(config_id, f"Tunnel '{tp.config.name}' stopped")
 
+    def start_all(self, configs: Iterable[TunnelConfig]) -> None:
+        """Start every idle tunnel; running or retrying ones are left alone."""
+        for config in configs:
+            if self.get_state(config.id) in (TunnelState.DISCONNECTED, TunnelState.ERROR):
+                self.start(config)
+
     def stop_all(self) -> None:
         """Stop all running tunnels."""
         for config_id in list(self._tunnels.keys()):
             self.stop(config_id)
 
+    def shutdown(self) -> None:
+        """Cancel all pending retry timers and block reconnects ahead of app exit."""
+        self._shutting_down = True
+        for tp in self._tunnels.values():
+            tp.intentional_stop = True
+            if tp.retry_timer is not None:
+                tp.retry_timer.stop()
+                tp.retry_timer = None
+
     def get_state(self, config_id: str) -> TunnelState:
         tp = self._tunnels.get(config_id)
         return tp.state if tp else TunnelState.DISCONNECTED
 
     def _launch(self, tp: TunnelProcess) -> None:
         """Launch the SSH process for a tunnel."""
+        # Built per launch so reconnects pick up in-place config edits (e.g. a new key)
         cmd = build_ssh_command(tp.config)
         logger.info("Starting tunnel '%s': %s", tp.config.name, " ".join(cmd))
         self.tunnel_log.emit(tp.config.id, f"Starting tunnel: {' '.join(cmd)}")
 
         process = QProcess(self)
         tp.process = process
-        tp.stderr_buffer = ""
+        tp.stderr_buffer = bytearray()
+        tp.line_buffer = bytearray()
         tp.intentional_stop = False
 
-        # Set SSH_ASKPASS so password/passphrase prompts show a GUI dialog
-        env = QProcessEnvironment.systemEnvironment()
-        env.insert("SSH_ASKPASS", ASKPASS_SCRIPT)
-        env.insert("SSH_ASKPASS_REQUIRE", "force")
-        process.setProcessEnvironment(env)
+        process.setProcessEnvironment(askpass_env())
 
         process.setProgram(cmd[0])
         process.setArguments(cmd[1:])
 
-        process.readyReadStandardError.connect(lambda: self._on_stderr(tp))
-        process.started.connect(lambda: self._on_started(tp))
-        process.finished.connect(lambda code, status: self._on_finished(tp, code, status))
+        process.readyReadStandardError.connect(partial(self._on_stderr, tp))
+        process.started.connect(partial(self._on_started, tp))
+        process.finished.connect(partial(self._on_finished, tp))
 
         process.start()
 
     def _on_started(self, tp: TunnelProcess) -> None:
         """Called when the SSH process starts."""
         self._set_state(tp, TunnelState.CONNECTED)
-        tp.retry_count = 0
+        tp.connected_at = time.monotonic()
         self.tunnel_log.emit(tp.config.id, f"Tunnel '{tp.config.name}' connected")
 
     def _on_stderr(self, tp: TunnelProcess) -> None:
         """Accumulate stderr output."""
         if tp.process is None:
             return
-        data = tp.process.readAllStandardError().data().decode(errors="replace")
+        data = tp.process.readAllStandardError().data()
         tp.stderr_buffer += data
-        # Log each complete line
-        while "\n" in tp.stderr_buffer:
-            line, tp.stderr_buffer = tp.stderr_buffer.split("\n", 1)
-            line = line.strip()
-            if line:
-                self.tunnel_log.emit(tp.config.id, f"[ssh] {line}")
+        if len(tp.stderr_buffer) > MAX_STDERR_BUFFER_BYTES:
+            del tp.stderr_buffer[: len(tp.stderr_buffer) - MAX_STDERR_BUFFER_BYTES]
+        if self.receivers(SIGNAL("tunnel_log(QString,QString)")) == 0:
+            # Keep the buffer for error parsing, but skip per-line log work
+            return
+        # Queue each complete line; a short timer flushes them as one log entry
+        tp.line_buffer += data
+        tp.pending_log_lines += pop_lines(tp.line_buffer, b"[ssh] ")
+        if len(tp.line_buffer) > MAX_STDERR_BUFFER_BYTES:
+            del tp.line_buffer[: len(tp.line_buffer) // 2]
+
+        if not tp.pending_log_lines:
+            return
+        if tp.log_flush_timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+            timer.timeout.connect(partial(self._flush_log, tp))
+            tp.log_flush_timer = timer
+        if not tp.log_flush_timer.isActive():
+            tp.log_flush_timer.start()
+
+    def _flush_log(self, tp: TunnelProcess) -> None:
+        """Emit queued stderr lines as a single log message, decoded once."""
+        if not tp.pending_log_lines:
+            return
+        lines, tp.pending_log_lines = tp.pending_log_lines, []
+        self.tunnel_log.emit(tp.config.id, b"\n".join(lines).decode(errors="replace"))
 
     def _on_finished(
         self, tp: TunnelProcess, exit_code: int, exit_status: QProcess.ExitStatus
     ) -> None:
         """Handle process exit — reconnect on unexpected failures."""
+        if tp.log_flush_timer is not None:
+            tp.log_flush_timer.stop()
+        self._flush_log(tp)
+
         if tp.intentional_stop:
             self._set_state(tp, TunnelState.DISCONNECTED)
             return
 
+        if was_stable(tp.connected_at):
+            tp.retry_count = 0
+        tp.connected_at = None
+
         error_msg = parse_ssh_error(tp.stderr_buffer)
         self.tunnel_error.emit(tp.config.id, error_msg)
         self.tunnel_log.emit(
@@ -219,6 +292,8 @@ class TunnelManager(QObject):
 
     def _schedule_reconnect(self, tp: TunnelProcess) -> None:
         """Schedule a reconnection attempt with exponential backoff."""
+        if self._shutting_down:
+            return
         if tp.retry_count >= MAX_RETRIES:
             self._set_state(tp, TunnelState.ERROR)
             self.tunnel_error.emit(
@@ -231,10 +306,7 @@ class TunnelManager(QObject):
             )
             return
 
-        delay = min(
-            INITIAL_RETRY_DELAY_MS * (BACKOFF_FACTOR**tp.retry_count),
-            MAX_RETRY_DELAY_MS,
-        )
+        delay = retry_delay_ms(tp.retry_count)
         tp.retry_count += 1
         self._set_state(tp, TunnelState.RECONNECTING)
         self.tunnel_log.emit(
@@ -244,8 +316,8 @@ class TunnelManager(QObject):
 
         timer = QTimer(self)
         timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self._do_reconnect(tp))
-        timer.start(int(delay))
+        timer.timeout.connect(partial(self._do_reconnect, tp))
+        timer.start(delay)
         tp.retry_timer = timer
 
     def _do_reconnect(self, tp: TunnelProcess) -> None:
@@ -255,5 +327,7 @@ class TunnelManager(QObject):
         self._launch(tp)
 
     def _set_state(self, tp: TunnelProcess, state: TunnelState) -> None:
+        if tp.state == state:
+            return
         tp.state = state
         self.tunnel_state_changed.emit(tp.config.id, state)
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-import uuid
+import sys
 from dataclasses import dataclass, field
+from secrets import token_hex
 
 
-@dataclass
+def new_config_id() -> str:
+    """Return a fresh opaque identifier for a tunnel or mount config."""
+    # Ids key every manager and UI lookup table; interned keys compare by identity
+    return sys.intern(token_hex(16))
+
+
+@dataclass(slots=True)
 class ForwardRule:
     """A single SSH -L forwarding rule."""
 
@@ -28,12 +35,12 @@ class ForwardRule:
     def from_dict(cls, data: dict[str, int | str]) -> ForwardRule:
         return cls(
             local_port=int(data["local_port"]),
-            remote_host=str(data["remote_host"]),
+            remote_host=sys.intern(str(data["remote_host"])),
             remote_port=int(data["remote_port"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TunnelConfig:
     """Configuration for an SSH tunnel."""
 
@@ -45,7 +52,7 @@ class TunnelConfig:
     extra_ssh_flags: str = ""
     connect_on_startup: bool = False
     identity_file: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_config_id)
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -65,10 +72,11 @@ class TunnelConfig:
         rules_data = data.get("forward_rules", [])
         assert isinstance(rules_data, list)
         return cls(
-            id=str(data.get("id", uuid.uuid4())),
+            id=sys.intern(str(data["id"])) if "id" in data else new_config_id(),
             name=str(data["name"]),
-            host=str(data["host"]),
-            user=str(data["user"]),
+            # Hosts and users repeat across entries; interning shares one string each
+            host=sys.intern(str(data["host"])),
+            user=sys.intern(str(data["user"])),
             port=int(data.get("port", 22)),  # type: ignore[arg-type]
             forward_rules=[ForwardRule.from_dict(r) for r in rules_data],
             extra_ssh_flags=str(data.get("extra_ssh_flags", "")),
@@ -77,7 +85,7 @@ class TunnelConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MountConfig:
     """Configuration for an SSHFS mount."""
 
@@ -90,7 +98,7 @@ class MountConfig:
     sshfs_flags: str = ""
     connect_on_startup: bool = False
     identity_file: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_config_id)
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -109,10 +117,10 @@ class MountConfig:
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> MountConfig:
         return cls(
-            id=str(data.get("id", uuid.uuid4())),
+            id=sys.intern(str(data["id"])) if "id" in data else new_config_id(),
             name=str(data["name"]),
-            host=str(data["host"]),
-            user=str(data["user"]),
+            host=sys.intern(str(data["host"])),
+            user=sys.intern(str(data["user"])),
             remote_path=str(data["remote_path"]),
             local_mount=str(data["local_mount"]),
             port=int(data.get("port", 22)),  # type: ignore[arg-type]
@@ -122,7 +130,7 @@ class MountConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Top-level application configuration."""
 
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
+# Project-root resources, used when running from a source checkout
+_DEV_RESOURCES_DIR = Path(__file__).parents[2] / "resources" / "icons"
 
+
+@functools.lru_cache(maxsize=1)
 def get_resources_dir() -> Path:
     """Return the path to the resources/icons directory.
 
@@ -14,9 +19,10 @@ def get_resources_dir() -> Path:
     """
     if hasattr(sys, "_MEIPASS"):
         return Path(sys._MEIPASS) / "resources" / "icons"  # type: ignore[attr-defined]
-    return Path(__file__).parent.parent.parent / "resources" / "icons"
+    return _DEV_RESOURCES_DIR
 
 
+@functools.lru_cache(maxsize=1)
 def get_askpass_path() -> str:
     """Return the path to the askpass helper executable.
 
@@ -39,7 +39,7 @@ class KeySetupDialog(QDialog):
         self._port = port
         self._key_path: str = ""
         self._deploy_process: QProcess | None = None
-        self._stderr_buffer: str = ""
+        self._stderr_buffer = bytearray()
 
         self.setWindowTitle("Setup SSH Key")
         self.setMinimumWidth(420)
@@ -95,7 +95,7 @@ class KeySetupDialog(QDialog):
 
         process = deploy_key(pub_path, self._host, self._user, self._port, self)
         self._deploy_process = process
-        self._stderr_buffer = ""
+        self._stderr_buffer = bytearray()
 
         process.readyReadStandardError.connect(self._on_stderr)
         process.finished.connect(self._on_deploy_finished)
@@ -104,10 +104,7 @@ class KeySetupDialog(QDialog):
     def _on_stderr(self) -> None:
         if self._deploy_process is None:
             return
-        data = self._deploy_process.readAllStandardError().data().decode(
-            errors="replace"
-        )
-        self._stderr_buffer += data
+        self._stderr_buffer += self._deploy_process.readAllStandardError().data()
 
     def _on_deploy_finished(self, exit_code: int, _status: object) -> None:
         if exit_code == 0:
@@ -118,7 +115,7 @@ class KeySetupDialog(QDialog):
             ).setEnabled(True)
         else:
             # Trim stderr for display
-            err = self._stderr_buffer.strip().splitlines()
+            err = self._stderr_buffer.decode(errors="replace").strip().splitlines()
             err_msg = err[-1] if err else "Unknown error"
             self._step2_label.setText("Step 2: Deployment FAILED")
             self._result_label.setText(f"Error: {err_msg}")
@@ -2,26 +2,34 @@
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime
 
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+# Per-connection history kept in memory, and lines kept in the display
+MAX_LOG_ENTRIES = 2000
+
 
 class LogPanel(QWidget):
     """Collapsible log panel showing timestamped events per connection."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        # logs[config_id] = list of "(timestamp) message"
-        self._logs: dict[str, list[str]] = {}
-        self._current_id: str | None = None
+        # logs[config_id] = most recent "(timestamp) message" entries
+        self._logs: dict[str, deque[str]] = {}
+        # Selector display names by config_id, so lookups skip the combobox
+        self._names: dict[str, str] = {}
+        # config_id of the selected filter ("" means all connections)
+        self._current_id: str = ""
 
         self._setup_ui()
 
@@ -44,56 +52,60 @@ class LogPanel(QWidget):
         layout.addLayout(header)
 
         # Log display
-        self._text = QTextEdit()
+        self._text = QPlainTextEdit()
         self._text.setReadOnly(True)
-        self._text.setFontFamily("monospace")
+        self._text.setFont(QFont("monospace"))
+        self._text.setMaximumBlockCount(MAX_LOG_ENTRIES)
         self._text.setMaximumHeight(200)
         layout.addWidget(self._text)
 
     def add_log(self, config_id: str, message: str, config_name: str | None = None) -> None:
-        """Append a log entry for a connection."""
+        """Append a log entry for a connection.
+
+        A multi-line message (a batch of process output) becomes one
+        timestamped entry per line, so every line carries its prefix.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {message}"
+        entries = [f"[{timestamp}] {line}" for line in message.split("\n")]
 
-        if config_id not in self._logs:
-            self._logs[config_id] = []
+        display_name = self._names.get(config_id)
+        if display_name is None:
             display_name = config_name or config_id[:8]
+            self._names[config_id] = display_name
             self._selector.addItem(display_name, config_id)
 
-        self._logs[config_id].append(entry)
+        history = self._logs.get(config_id)
+        if history is None:
+            history = self._logs[config_id] = deque(maxlen=MAX_LOG_ENTRIES)
+        history.extend(entries)
 
         # If currently viewing this connection or "All", append to display
-        selected_id = self._selector.currentData()
-        if selected_id == "" or selected_id == config_id:
-            prefix = f"[{config_name or config_id[:8]}] " if selected_id == "" else ""
-            self._text.append(f"{prefix}{entry}")
+        selected_id = self._current_id
+        if selected_id == "":
+            self._text.appendPlainText("\n".join(f"[{display_name}] {e}" for e in entries))
+        elif selected_id == config_id:
+            self._text.appendPlainText("\n".join(entries))
 
     def _on_selection_changed(self, index: int) -> None:
         """Refresh display when the connection filter changes."""
-        self._text.clear()
-        selected_id = self._selector.currentData()
+        selected_id = self._current_id = self._selector.itemData(index) or ""
 
+        # Build the text once and assign it in bulk to avoid a layout pass per line
+        lines: list[str] = []
         if selected_id == "":
             # Show all logs interleaved (by insertion order per-connection)
             for cid, entries in self._logs.items():
-                name = self._name_for_id(cid)
-                for entry in entries:
-                    self._text.append(f"[{name}] {entry}")
+                name = self._names.get(cid, cid[:8])
+                lines.extend(f"[{name}] {entry}" for entry in entries)
         elif selected_id in self._logs:
-            for entry in self._logs[selected_id]:
-                self._text.append(entry)
+            lines.extend(self._logs[selected_id])
+        self._text.setPlainText("\n".join(lines))
 
     def _clear_current(self) -> None:
         """Clear logs for the currently selected connection."""
-        selected_id = self._selector.currentData()
+        selected_id = self._current_id
         if selected_id == "":
             self._logs.clear()
         elif selected_id in self._logs:
             self._logs[selected_id].clear()
         self._text.clear()
-
-    def _name_for_id(self, config_id: str) -> str:
-        for i in range(self._selector.count()):
-            if self._selector.itemData(i) == config_id:
-                return self._selector.itemText(i)
-        return config_id[:8]
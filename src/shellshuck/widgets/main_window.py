@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHeaderView,
@@ -11,8 +19,7 @@ from PySide6.QtWidgets import (
     QMenu,
     QPushButton,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QToolBar,
     QWidget,
 )
@@ -32,28 +39,35 @@ STATE_COLORS = {
 }
 
 
-def _tunnel_state_label(state: TunnelState) -> tuple[str, QColor]:
-    mapping = {
-        TunnelState.DISCONNECTED: ("Disconnected", STATE_COLORS["disconnected"]),
-        TunnelState.CONNECTING: ("Connecting...", STATE_COLORS["connecting"]),
-        TunnelState.CONNECTED: ("Connected", STATE_COLORS["connected"]),
-        TunnelState.RECONNECTING: ("Reconnecting...", STATE_COLORS["reconnecting"]),
-        TunnelState.ERROR: ("Error", STATE_COLORS["error"]),
-    }
-    return mapping.get(state, ("Unknown", STATE_COLORS["disconnected"]))
+STATE_BRUSHES = {key: QBrush(color) for key, color in STATE_COLORS.items()}
+
+TUNNEL_LABELS: dict[TunnelState, tuple[str, QBrush]] = {
+    TunnelState.DISCONNECTED: ("Disconnected", STATE_BRUSHES["disconnected"]),
+    TunnelState.CONNECTING: ("Connecting...", STATE_BRUSHES["connecting"]),
+    TunnelState.CONNECTED: ("Connected", STATE_BRUSHES["connected"]),
+    TunnelState.RECONNECTING: ("Reconnecting...", STATE_BRUSHES["reconnecting"]),
+    TunnelState.ERROR: ("Error", STATE_BRUSHES["error"]),
+}
+
+MOUNT_LABELS: dict[MountState, tuple[str, QBrush]] = {
+    MountState.UNMOUNTED: ("Unmounted", STATE_BRUSHES["disconnected"]),
+    MountState.MOUNTING: ("Mounting...", STATE_BRUSHES["connecting"]),
+    MountState.MOUNTED: ("Mounted", STATE_BRUSHES["connected"]),
+    MountState.UNHEALTHY: ("Unhealthy", STATE_BRUSHES["unhealthy"]),
+    MountState.UNMOUNTING: ("Unmounting...", STATE_BRUSHES["connecting"]),
+    MountState.RECONNECTING: ("Reconnecting...", STATE_BRUSHES["reconnecting"]),
+    MountState.ERROR: ("Error", STATE_BRUSHES["error"]),
+}
+
+_UNKNOWN_LABEL = ("Unknown", STATE_BRUSHES["disconnected"])
+
 
+def _tunnel_state_label(state: TunnelState) -> tuple[str, QBrush]:
+    return TUNNEL_LABELS.get(state, _UNKNOWN_LABEL)
 
-def _mount_state_label(state: MountState) -> tuple[str, QColor]:
-    mapping = {
-        MountState.UNMOUNTED: ("Unmounted", STATE_COLORS["disconnected"]),
-        MountState.MOUNTING: ("Mounting...", STATE_COLORS["connecting"]),
-        MountState.MOUNTED: ("Mounted", STATE_COLORS["connected"]),
-        MountState.UNHEALTHY: ("Unhealthy", STATE_COLORS["unhealthy"]),
-        MountState.UNMOUNTING: ("Unmounting...", STATE_COLORS["connecting"]),
-        MountState.RECONNECTING: ("Reconnecting...", STATE_COLORS["reconnecting"]),
-        MountState.ERROR: ("Error", STATE_COLORS["error"]),
-    }
-    return mapping.get(state, ("Unknown", STATE_COLORS["disconnected"]))
+
+def _mount_state_label(state: MountState) -> tuple[str, QBrush]:
+    return MOUNT_LABELS.get(state, _UNKNOWN_LABEL)
 
 
 COL_NAME = 0
@@ -61,6 +75,153 @@ COL_TYPE = 1
 COL_TARGET = 2
 COL_STATUS = 3
 
+# Window for coalescing bursts of state changes into one table update
+STATUS_FLUSH_DELAY_MS = 16
+
+HEADERS = ("Name", "Type", "Target", "Status")
+KIND_LABELS = {"tunnel": "Tunnel", "mount": "Mount"}
+
+
+class ConnectionTableModel(QAbstractTableModel):
+    """Table model holding one row per tunnel or mount.
+
+    Rows are stored column-wise in parallel lists so data() is a single
+    list index, and status changes only invalidate the one affected cell.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._ids: list[str] = []
+        self._kinds: list[str] = []
+        self._names: list[str] = []
+        self._targets: list[str] = []
+        self._statuses: list[str] = []
+        self._brushes: list[QBrush] = []
+        self._row_by_id: dict[str, int] = {}
+
+    def rowCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == COL_NAME:
+                return self._names[row]
+            if col == COL_TYPE:
+                return KIND_LABELS[self._kinds[row]]
+            if col == COL_TARGET:
+                return self._targets[row]
+            if col == COL_STATUS:
+                return self._statuses[row]
+        elif role == Qt.ItemDataRole.ForegroundRole and col == COL_STATUS:
+            return self._brushes[row]
+        return None
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def set_rows(self, rows: list[tuple[str, str, str, str, str, QBrush]]) -> None:
+        """Replace all rows with (id, kind, name, target, status, brush) tuples."""
+        self.beginResetModel()
+        self._ids = [r[0] for r in rows]
+        self._kinds = [r[1] for r in rows]
+        self._names = [r[2] for r in rows]
+        self._targets = [r[3] for r in rows]
+        self._statuses = [r[4] for r in rows]
+        self._brushes = [r[5] for r in rows]
+        self._reindex()
+        self.endResetModel()
+
+    def update_rows(self, rows: list[tuple[str, str, str, str, str, QBrush]]) -> None:
+        """Apply rows by id, inserting, removing and updating only what changed.
+
+        Falls back to a full reset if existing rows were reordered.
+        """
+        new_ids = {r[0] for r in rows}
+        for row in range(len(self._ids) - 1, -1, -1):
+            if self._ids[row] not in new_ids:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._ids[row]
+                del self._kinds[row]
+                del self._names[row]
+                del self._targets[row]
+                del self._statuses[row]
+                del self._brushes[row]
+                self.endRemoveRows()
+        self._reindex()
+
+        for row, (config_id, kind, name, target, status, brush) in enumerate(rows):
+            if row < len(self._ids) and self._ids[row] == config_id:
+                if (
+                    self._kinds[row] != kind
+                    or self._names[row] != name
+                    or self._targets[row] != target
+                    or self._statuses[row] != status
+                    or self._brushes[row] != brush
+                ):
+                    self._kinds[row] = kind
+                    self._names[row] = name
+                    self._targets[row] = target
+                    self._statuses[row] = status
+                    self._brushes[row] = brush
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, len(HEADERS) - 1))
+            elif config_id in self._row_by_id:
+                self.set_rows(rows)
+                return
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._ids.insert(row, config_id)
+                self._kinds.insert(row, kind)
+                self._names.insert(row, name)
+                self._targets.insert(row, target)
+                self._statuses.insert(row, status)
+                self._brushes.insert(row, brush)
+                self.endInsertRows()
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._row_by_id = {config_id: row for row, config_id in enumerate(self._ids)}
+
+    def set_status(self, config_id: str, label: str, brush: QBrush) -> None:
+        """Update the status cell for a connection."""
+        row = self._row_by_id.get(config_id)
+        if row is None:
+            return
+        self._statuses[row] = label
+        self._brushes[row] = brush
+        index = self.index(row, COL_STATUS)
+        self.dataChanged.emit(
+            index,
+            index,
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+        )
+
+    def row_info(self, row: int) -> tuple[str, str] | None:
+        """Return (config_id, conn_type) for a row, or None if out of range."""
+        if 0 <= row < len(self._ids):
+            return self._ids[row], self._kinds[row]
+        return None
+
 
 class MainWindow(QMainWindow):
     """Main application window with connection table."""
@@ -81,21 +242,35 @@ class MainWindow(QMainWindow):
     ) -> None:
         super().__init__(parent)
         self._config = config
+        self._rebuild_indexes()
         self._tunnel_manager = tunnel_manager
         self._mount_manager = mount_manager
+        self._pending_status: dict[str, tuple[str, QBrush]] = {}
+
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(STATUS_FLUSH_DELAY_MS)
+        self._status_flush_timer.timeout.connect(self._flush_status)
 
         self.setWindowTitle("Shellshuck — SSH Manager")
         self.setMinimumSize(700, 400)
 
         self._setup_toolbar()
         self._setup_table()
+        self._setup_context_menu()
         self._connect_signals()
         self.refresh_table()
 
     def set_config(self, config: AppConfig) -> None:
-        """Update the config and refresh the table."""
+        """Update the config and apply the differences to the table."""
         self._config = config
-        self.refresh_table()
+        self._rebuild_indexes()
+        self._apply_config_diff(config)
+
+    def _rebuild_indexes(self) -> None:
+        """Build the id lookup tables used by the context menu and double-click."""
+        self._tunnels_by_id = {t.id: t for t in self._config.tunnels}
+        self._mounts_by_id = {m.id: m for m in self._config.mounts}
 
     def _setup_toolbar(self) -> None:
         toolbar = QToolBar("Main Toolbar")
@@ -121,9 +296,9 @@ class MainWindow(QMainWindow):
         toolbar.addWidget(btn_disconnect_all)
 
     def _setup_table(self) -> None:
-        self._table = QTableWidget()
-        self._table.setColumnCount(4)
-        self._table.setHorizontalHeaderLabels(["Name", "Type", "Target", "Status"])
+        self._model = ConnectionTableModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.horizontalHeader().setSectionResizeMode(
             COL_TARGET, QHeaderView.ResizeMode.Stretch
         )
@@ -150,45 +325,36 @@ class MainWindow(QMainWindow):
         return self._log_panel
 
     def _connect_signals(self) -> None:
-        self._tunnel_manager.tunnel_state_changed.connect(self._on_tunnel_state_changed)
-        self._mount_manager.mount_state_changed.connect(self._on_mount_state_changed)
+        # Both managers live on and emit from the GUI thread
+        direct = Qt.ConnectionType.DirectConnection
+        self._tunnel_manager.tunnel_state_changed.connect(self._on_tunnel_state_changed, direct)
+        self._mount_manager.mount_state_changed.connect(self._on_mount_state_changed, direct)
 
     def refresh_table(self) -> None:
         """Rebuild the table from config + current states."""
-        self._table.setRowCount(0)
-        self._row_map: dict[int, tuple[str, str]] = {}
-
-        row = 0
-        for t in self._config.tunnels:
-            self._table.insertRow(row)
-            self._table.setItem(row, COL_NAME, QTableWidgetItem(t.name))
-            self._table.setItem(row, COL_TYPE, QTableWidgetItem("Tunnel"))
+        self._model.set_rows(self._build_rows(self._config))
+
+    def _apply_config_diff(self, config: AppConfig) -> None:
+        """Insert, remove or update only the rows that differ from the table."""
+        self._model.update_rows(self._build_rows(config))
+
+    def _build_rows(self, config: AppConfig) -> list[tuple[str, str, str, str, str, QBrush]]:
+        rows: list[tuple[str, str, str, str, str, QBrush]] = []
+
+        for t in config.tunnels:
             target = f"{t.user}@{t.host}:{t.port}"
             if t.forward_rules:
                 forwards = ", ".join(r.to_ssh_arg() for r in t.forward_rules)
                 target += f" [{forwards}]"
-            self._table.setItem(row, COL_TARGET, QTableWidgetItem(target))
-            state = self._tunnel_manager.get_state(t.id)
-            label, color = _tunnel_state_label(state)
-            status_item = QTableWidgetItem(label)
-            status_item.setForeground(color)
-            self._table.setItem(row, COL_STATUS, status_item)
-            self._row_map[row] = (t.id, "tunnel")
-            row += 1
-
-        for m in self._config.mounts:
-            self._table.insertRow(row)
-            self._table.setItem(row, COL_NAME, QTableWidgetItem(m.name))
-            self._table.setItem(row, COL_TYPE, QTableWidgetItem("Mount"))
+            label, brush = _tunnel_state_label(self._tunnel_manager.get_state(t.id))
+            rows.append((t.id, "tunnel", t.name, target, label, brush))
+
+        for m in config.mounts:
             target = f"{m.user}@{m.host}:{m.remote_path} -> {m.local_mount}"
-            self._table.setItem(row, COL_TARGET, QTableWidgetItem(target))
-            state = self._mount_manager.get_state(m.id)
-            label, color = _mount_state_label(state)
-            status_item = QTableWidgetItem(label)
-            status_item.setForeground(color)
-            self._table.setItem(row, COL_STATUS, status_item)
-            self._row_map[row] = (m.id, "mount")
-            row += 1
+            label, brush = _mount_state_label(self._mount_manager.get_state(m.id))
+            rows.append((m.id, "mount", m.name, target, label, brush))
+
+        return rows
 
     def _on_tunnel_state_changed(self, config_id: str, state: TunnelState) -> None:
         self._update_status_for(config_id, *_tunnel_state_label(state))
@@ -196,96 +362,125 @@ class MainWindow(QMainWindow):
     def _on_mount_state_changed(self, config_id: str, state: MountState) -> None:
         self._update_status_for(config_id, *_mount_state_label(state))
 
-    def _update_status_for(self, config_id: str, label: str, color: QColor) -> None:
-        for row, (cid, _) in self._row_map.items():
-            if cid == config_id:
-                item = QTableWidgetItem(label)
-                item.setForeground(color)
-                self._table.setItem(row, COL_STATUS, item)
-                break
+    def _update_status_for(self, config_id: str, label: str, brush: QBrush) -> None:
+        # Restart the timer so a burst of changes is applied in one pass
+        self._pending_status[config_id] = (label, brush)
+        self._status_flush_timer.start()
+
+    def _flush_status(self) -> None:
+        pending, self._pending_status = self._pending_status, {}
+        for config_id, (label, brush) in pending.items():
+            self._model.set_status(config_id, label, brush)
 
     def _get_row_info(self, row: int) -> tuple[str, str] | None:
-        return self._row_map.get(row)
+        return self._model.row_info(row)
+
+    def _setup_context_menu(self) -> None:
+        # Built once; actions read the row the menu was opened on, and whether it
+        # was active then, from _menu_context
+        self._menu_context: tuple[str, str, bool] | None = None
+        self._context_menu = QMenu(self)
+        self._act_toggle = self._context_menu.addAction("Connect")
+        self._act_toggle.triggered.connect(self._on_menu_toggle)
+        self._context_menu.addAction("Edit").triggered.connect(self._on_menu_edit)
+        self._context_menu.addAction("Setup SSH Key").triggered.connect(self._on_menu_setup_key)
+        self._context_menu.addSeparator()
+        self._context_menu.addAction("Delete").triggered.connect(self._on_menu_delete)
 
     def _show_context_menu(self, pos: object) -> None:
-        row = self._table.currentRow()
+        row = self._table.currentIndex().row()
         info = self._get_row_info(row)
         if info is None:
             return
         config_id, conn_type = info
+        active = self._is_active(config_id, conn_type)
+        # Fix the action now so a state change while the menu is open can't flip it
+        self._menu_context = (config_id, conn_type, active)
 
-        menu = QMenu(self)
-
+        if active:
+            self._act_toggle.setText("Disconnect")
+            self._act_toggle.setVisible(True)
+        else:
+            self._act_toggle.setText("Connect")
+            found = (
+                self._find_tunnel(config_id)
+                if conn_type == "tunnel"
+                else self._find_mount(config_id)
+            )
+            self._act_toggle.setVisible(found is not None)
+
+        self._context_menu.popup(self._table.viewport().mapToGlobal(pos))  # type: ignore[arg-type]
+
+    def _on_menu_toggle(self) -> None:
+        if self._menu_context is not None:
+            self._set_connected(*self._menu_context)
+
+    def _on_menu_edit(self) -> None:
+        if self._menu_context is None:
+            return
+        config_id, conn_type, _ = self._menu_context
         if conn_type == "tunnel":
-            state = self._tunnel_manager.get_state(config_id)
-            if state in (TunnelState.CONNECTED, TunnelState.CONNECTING, TunnelState.RECONNECTING):
-                menu.addAction("Disconnect", lambda: self._tunnel_manager.stop(config_id))
-            else:
-                config = self._find_tunnel(config_id)
-                if config:
-                    menu.addAction("Connect", lambda: self._tunnel_manager.start(config))
-            menu.addAction("Edit", lambda: self.edit_tunnel_requested.emit(config_id))
+            self.edit_tunnel_requested.emit(config_id)
         else:
-            state = self._mount_manager.get_state(config_id)
-            if state in (MountState.MOUNTED, MountState.MOUNTING, MountState.RECONNECTING):
-                menu.addAction("Disconnect", lambda: self._mount_manager.unmount(config_id))
-            else:
-                config = self._find_mount(config_id)
-                if config:
-                    menu.addAction("Connect", lambda: self._mount_manager.mount(config))
-            menu.addAction("Edit", lambda: self.edit_mount_requested.emit(config_id))
-
-        menu.addAction(
-            "Setup SSH Key",
-            lambda: self.setup_key_requested.emit(config_id, conn_type),
-        )
-        menu.addSeparator()
-        menu.addAction("Delete", lambda: self.delete_requested.emit(config_id, conn_type))
+            self.edit_mount_requested.emit(config_id)
 
-        menu.popup(self._table.viewport().mapToGlobal(pos))  # type: ignore[arg-type]
+    def _on_menu_setup_key(self) -> None:
+        if self._menu_context is not None:
+            config_id, conn_type, _ = self._menu_context
+            self.setup_key_requested.emit(config_id, conn_type)
+
+    def _on_menu_delete(self) -> None:
+        if self._menu_context is not None:
+            config_id, conn_type, _ = self._menu_context
+            self.delete_requested.emit(config_id, conn_type)
 
     def _on_double_click(self, index: object) -> None:
-        row = self._table.currentRow()
+        row = self._table.currentIndex().row()
         info = self._get_row_info(row)
         if info is None:
             return
-        config_id, conn_type = info
+        self._toggle_connection(*info)
 
+    def _is_active(self, config_id: str, conn_type: str) -> bool:
         if conn_type == "tunnel":
             state = self._tunnel_manager.get_state(config_id)
-            if state in (TunnelState.CONNECTED, TunnelState.CONNECTING, TunnelState.RECONNECTING):
+            return state in (
+                TunnelState.CONNECTED,
+                TunnelState.CONNECTING,
+                TunnelState.RECONNECTING,
+            )
+        return self._mount_manager.get_state(config_id) in (
+            MountState.MOUNTED,
+            MountState.MOUNTING,
+            MountState.RECONNECTING,
+        )
+
+    def _toggle_connection(self, config_id: str, conn_type: str) -> None:
+        """Disconnect an active connection, or connect an inactive one."""
+        self._set_connected(config_id, conn_type, self._is_active(config_id, conn_type))
+
+    def _set_connected(self, config_id: str, conn_type: str, active: bool) -> None:
+        """Stop the connection if it was active, otherwise start it."""
+        if conn_type == "tunnel":
+            if active:
                 self._tunnel_manager.stop(config_id)
-            else:
-                config = self._find_tunnel(config_id)
-                if config:
-                    self._tunnel_manager.start(config)
-        else:
-            state = self._mount_manager.get_state(config_id)
-            if state in (MountState.MOUNTED, MountState.MOUNTING, MountState.RECONNECTING):
-                self._mount_manager.unmount(config_id)
-            else:
-                config = self._find_mount(config_id)
-                if config:
-                    self._mount_manager.mount(config)
+            elif tunnel := self._find_tunnel(config_id):
+                self._tunnel_manager.start(tunnel)
+        elif active:
+            self._mount_manager.unmount(config_id)
+        elif mount := self._find_mount(config_id):
+            self._mount_manager.mount(mount)
 
     def _connect_all(self) -> None:
-        for t in self._config.tunnels:
-            self._tunnel_manager.start(t)
-        for m in self._config.mounts:
-            self._mount_manager.mount(m)
+        self._tunnel_manager.start_all(self._config.tunnels)
+        self._mount_manager.mount_all(self._config.mounts)
 
     def _disconnect_all(self) -> None:
         self._tunnel_manager.stop_all()
         self._mount_manager.unmount_all()
 
     def _find_tunnel(self, config_id: str) -> TunnelConfig | None:
-        for t in self._config.tunnels:
-            if t.id == config_id:
-                return t
-        return None
+        return self._tunnels_by_id.get(config_id)
 
     def _find_mount(self, config_id: str) -> MountConfig | None:
-        for m in self._config.mounts:
-            if m.id == config_id:
-                return m
-        return None
+        return self._mounts_by_id.get(config_id)
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import uuid
-
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -18,7 +16,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from shellshuck.models import MountConfig
+from shellshuck.models import MountConfig, new_config_id
+from shellshuck.widgets.key_setup_dialog import KeySetupDialog
 
 
 class MountDialog(QDialog):
@@ -31,8 +30,7 @@ class MountDialog(QDialog):
     ) -> None:
         super().__init__(parent)
         self._mount = mount
-        self._editing = mount is not None
-        self.setWindowTitle("Edit Mount" if self._editing else "Add Mount")
+        self.setWindowTitle("Edit Mount" if mount is not None else "Add Mount")
         self.setMinimumWidth(500)
 
         self._setup_ui()
@@ -104,8 +102,6 @@ class MountDialog(QDialog):
         layout.addWidget(buttons)
 
     def _on_setup_key(self) -> None:
-        from shellshuck.widgets.key_setup_dialog import KeySetupDialog
-
         host = self._host.text().strip()
         user = self._user.text().strip()
         port = self._port.value()
@@ -139,7 +135,7 @@ class MountDialog(QDialog):
     def get_config(self) -> MountConfig:
         """Return a MountConfig from the current form values."""
         return MountConfig(
-            id=self._mount.id if self._mount else str(uuid.uuid4()),
+            id=self._mount.id if self._mount else new_config_id(),
             name=self._name.text().strip(),
             host=self._host.text().strip(),
             user=self._user.text().strip(),
@@ -16,6 +16,7 @@ from shellshuck.resources import get_resources_dir
 
 RESOURCES_DIR = get_resources_dir()
 SPLASH_PATH = RESOURCES_DIR / "shellshuck-splash.png"
+LOGO_SIZE = 240
 
 
 class SplashScreen(QDialog):
@@ -38,8 +39,8 @@ class SplashScreen(QDialog):
         pixmap = QPixmap(str(SPLASH_PATH))
         if not pixmap.isNull():
             scaled = pixmap.scaled(
-                240,
-                240,
+                LOGO_SIZE,
+                LOGO_SIZE,
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation,
             )
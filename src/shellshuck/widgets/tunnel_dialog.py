@@ -2,61 +2,149 @@
 
 from __future__ import annotations
 
-import uuid
-
+from dataclasses import replace
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+)
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
-    QLabel,
+    QHeaderView,
     QLineEdit,
     QPushButton,
     QSpinBox,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from shellshuck.models import ForwardRule, TunnelConfig
+from shellshuck.models import ForwardRule, TunnelConfig, new_config_id
+from shellshuck.widgets.key_setup_dialog import KeySetupDialog
+
+RULE_COL_LOCAL_PORT = 0
+RULE_COL_REMOTE_HOST = 1
+RULE_COL_REMOTE_PORT = 2
+RULE_HEADERS = ("Local port", "Remote host", "Remote port")
+PORT_MIN = 1
+PORT_MAX = 65535
 
 
-class ForwardRuleRow(QWidget):
-    """A single row for editing a forwarding rule."""
+class ForwardRulesModel(QAbstractTableModel):
+    """Editable table model over a list of forwarding rules."""
 
-    def __init__(self, rule: ForwardRule | None = None, parent: QWidget | None = None) -> None:
+    def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        self.local_port = QSpinBox()
-        self.local_port.setRange(1, 65535)
-        self.local_port.setValue(rule.local_port if rule else 8080)
-
-        self.remote_host = QLineEdit(rule.remote_host if rule else "localhost")
-        self.remote_host.setPlaceholderText("Remote host")
-
-        self.remote_port = QSpinBox()
-        self.remote_port.setRange(1, 65535)
-        self.remote_port.setValue(rule.remote_port if rule else 80)
-
-        self.remove_btn = QPushButton("Remove")
-
-        layout.addWidget(QLabel("Local:"))
-        layout.addWidget(self.local_port)
-        layout.addWidget(QLabel("→"))
-        layout.addWidget(self.remote_host)
-        layout.addWidget(QLabel(":"))
-        layout.addWidget(self.remote_port)
-        layout.addWidget(self.remove_btn)
-
-    def get_rule(self) -> ForwardRule:
-        return ForwardRule(
-            local_port=self.local_port.value(),
-            remote_host=self.remote_host.text().strip() or "localhost",
-            remote_port=self.remote_port.value(),
-        )
+        self._rules: list[ForwardRule] = []
+
+    def rowCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(self._rules)
+
+    def columnCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(RULE_HEADERS)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if not index.isValid() or role not in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.EditRole,
+        ):
+            return None
+        rule = self._rules[index.row()]
+        col = index.column()
+        if col == RULE_COL_LOCAL_PORT:
+            return rule.local_port
+        if col == RULE_COL_REMOTE_HOST:
+            return rule.remote_host
+        return rule.remote_port
+
+    def setData(  # noqa: N802
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: object,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        rule = self._rules[index.row()]
+        col = index.column()
+        if col == RULE_COL_REMOTE_HOST:
+            rule.remote_host = str(value).strip() or "localhost"
+        else:
+            try:
+                port = int(value)  # type: ignore[call-overload]
+            except (TypeError, ValueError):
+                return False
+            if not PORT_MIN <= port <= PORT_MAX:
+                return False
+            if col == RULE_COL_LOCAL_PORT:
+                rule.local_port = port
+            else:
+                rule.remote_port = port
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+        return True
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return RULE_HEADERS[section]
+        return None
+
+    def append_rule(self, rule: ForwardRule) -> None:
+        row = len(self._rules)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rules.append(rule)
+        self.endInsertRows()
+
+    def remove_rule(self, row: int) -> None:
+        if not 0 <= row < len(self._rules):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rules[row]
+        self.endRemoveRows()
+
+    def rules(self) -> list[ForwardRule]:
+        """Return copies of the current rules."""
+        return [replace(rule) for rule in self._rules]
+
+
+class PortDelegate(QStyledItemDelegate):
+    """Edits port cells with a spin box limited to valid port numbers."""
+
+    def createEditor(  # noqa: N802
+        self,
+        parent: QWidget,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> QWidget:
+        editor = QSpinBox(parent)
+        editor.setRange(PORT_MIN, PORT_MAX)
+        return editor
 
 
 class TunnelDialog(QDialog):
@@ -69,8 +157,7 @@ class TunnelDialog(QDialog):
     ) -> None:
         super().__init__(parent)
         self._tunnel = tunnel
-        self._editing = tunnel is not None
-        self.setWindowTitle("Edit Tunnel" if self._editing else "Add Tunnel")
+        self.setWindowTitle("Edit Tunnel" if tunnel is not None else "Add Tunnel")
         self.setMinimumWidth(500)
 
         self._setup_ui()
@@ -122,17 +209,31 @@ class TunnelDialog(QDialog):
         rules_group = QGroupBox("Port Forwarding Rules (-L)")
         rules_layout = QVBoxLayout(rules_group)
 
-        self._rules_container = QVBoxLayout()
-        rules_layout.addLayout(self._rules_container)
+        # Editors are only created for the cell being edited, not per rule
+        self._rules_model = ForwardRulesModel(self)
+        self._rules_view = QTableView()
+        self._rules_view.setModel(self._rules_model)
+        self._port_delegate = PortDelegate(self._rules_view)
+        self._rules_view.setItemDelegateForColumn(RULE_COL_LOCAL_PORT, self._port_delegate)
+        self._rules_view.setItemDelegateForColumn(RULE_COL_REMOTE_PORT, self._port_delegate)
+        self._rules_view.horizontalHeader().setSectionResizeMode(
+            RULE_COL_REMOTE_HOST, QHeaderView.ResizeMode.Stretch
+        )
+        self._rules_view.verticalHeader().setVisible(False)
+        self._rules_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        rules_layout.addWidget(self._rules_view)
 
+        rule_buttons = QHBoxLayout()
         add_rule_btn = QPushButton("Add Rule")
         add_rule_btn.clicked.connect(self._add_rule_row)
-        rules_layout.addWidget(add_rule_btn)
+        rule_buttons.addWidget(add_rule_btn)
+        remove_rule_btn = QPushButton("Remove Rule")
+        remove_rule_btn.clicked.connect(self._remove_rule_row)
+        rule_buttons.addWidget(remove_rule_btn)
+        rules_layout.addLayout(rule_buttons)
 
         layout.addWidget(rules_group)
 
-        self._rule_rows: list[ForwardRuleRow] = []
-
         # Buttons
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
@@ -142,19 +243,15 @@ class TunnelDialog(QDialog):
         layout.addWidget(buttons)
 
     def _add_rule_row(self, rule: ForwardRule | None = None) -> None:
-        row = ForwardRuleRow(rule)
-        row.remove_btn.clicked.connect(lambda: self._remove_rule_row(row))
-        self._rules_container.addWidget(row)
-        self._rule_rows.append(row)
+        # clicked passes a bool, so only accept an actual rule
+        if not isinstance(rule, ForwardRule):
+            rule = ForwardRule(local_port=8080, remote_host="localhost", remote_port=80)
+        self._rules_model.append_rule(rule)
 
-    def _remove_rule_row(self, row: ForwardRuleRow) -> None:
-        self._rules_container.removeWidget(row)
-        self._rule_rows.remove(row)
-        row.deleteLater()
+    def _remove_rule_row(self) -> None:
+        self._rules_model.remove_rule(self._rules_view.currentIndex().row())
 
     def _on_setup_key(self) -> None:
-        from shellshuck.widgets.key_setup_dialog import KeySetupDialog
-
         host = self._host.text().strip()
         user = self._user.text().strip()
         port = self._port.value()
@@ -176,17 +273,18 @@ class TunnelDialog(QDialog):
         self._identity_file.setText(tunnel.identity_file)
         self._connect_on_startup.setChecked(tunnel.connect_on_startup)
         for rule in tunnel.forward_rules:
-            self._add_rule_row(rule)
+            # Edit a copy so cancelling leaves the stored config untouched
+            self._add_rule_row(replace(rule))
 
     def get_config(self) -> TunnelConfig:
         """Return a TunnelConfig from the current form values."""
         return TunnelConfig(
-            id=self._tunnel.id if self._tunnel else str(uuid.uuid4()),
+            id=self._tunnel.id if self._tunnel else new_config_id(),
             name=self._name.text().strip(),
             host=self._host.text().strip(),
             user=self._user.text().strip(),
             port=self._port.value(),
-            forward_rules=[row.get_rule() for row in self._rule_rows],
+            forward_rules=self._rules_model.rules(),
             extra_ssh_flags=self._extra_flags.text().strip(),
             connect_on_startup=self._connect_on_startup.isChecked(),
             identity_file=self._identity_file.text().strip(),
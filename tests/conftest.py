@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import sys
 
 import pytest
 from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+# Read when the application is constructed; lets widget tests run headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 
 @pytest.fixture(scope="session")
 def qapp() -> QCoreApplication:
-    """Provide a QCoreApplication instance for tests needing Qt objects."""
-    app = QCoreApplication.instance()
+    """Provide one QApplication for the whole session; request it in Qt and widget tests."""
+    app = QApplication.instance()
     if app is None:
-        app = QCoreApplication(sys.argv)
+        app = QApplication(sys.argv)
     return app
@@ -1,7 +1,11 @@
 """Tests for config persistence."""
 
+import os
 from pathlib import Path
 
+import pytest
+
+from shellshuck import config as config_module
 from shellshuck.config import ConfigManager
 from shellshuck.models import AppConfig, ForwardRule, MountConfig, TunnelConfig
 
@@ -70,3 +74,39 @@ def test_ids_preserved_across_save_load(tmp_path: Path) -> None:
     loaded = manager.load()
     assert loaded.tunnels[0].id == tunnel.id
     assert loaded.mounts[0].id == mount.id
+
+
+def test_save_is_atomic(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text("stale", encoding="utf-8")
+    manager = ConfigManager(config_path=config_path)
+    manager.save(AppConfig(show_splash=False))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+    assert manager.load().show_splash is False
+
+
+def test_save_skips_unchanged_config(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(config_path=config_path)
+    config = AppConfig()
+    manager.save(config)
+    old_mtime = config_path.stat().st_mtime_ns - 10**9
+    os.utime(config_path, ns=(old_mtime, old_mtime))
+
+    manager.save(config)
+    assert config_path.stat().st_mtime_ns == old_mtime
+
+    config.show_splash = False
+    manager.save(config)
+    assert manager.load().show_splash is False
+
+
+def test_save_and_load_without_orjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config_module, "orjson", None)
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(config_path=config_path)
+    manager.save(AppConfig(tunnels=[TunnelConfig(name="t", host="h", user="u")]))
+
+    assert config_path.read_text(encoding="utf-8").endswith("\n")
+    assert manager.load().tunnels[0].name == "t"
@@ -0,0 +1,47 @@
+"""Tests for the per-connection log panel."""
+
+from __future__ import annotations
+
+import re
+
+from shellshuck.widgets.log_panel import LogPanel
+
+_TIMESTAMP = r"\[\d\d:\d\d:\d\d\]"
+
+
+def _lines(panel: LogPanel) -> list[str]:
+    return panel._text.toPlainText().splitlines()
+
+
+def test_batched_message_prefixes_every_line_in_all_view(qapp: object) -> None:
+    panel = LogPanel()
+    panel.add_log("id-a", "[ssh] one\n[ssh] two", config_name="alpha")
+    panel.add_log("id-b", "[sshfs] three", config_name="beta")
+
+    lines = _lines(panel)
+    assert len(lines) == 3
+    for line, (name, text) in zip(
+        lines, [("alpha", "[ssh] one"), ("alpha", "[ssh] two"), ("beta", "[sshfs] three")]
+    ):
+        assert re.fullmatch(rf"\[{name}\] {_TIMESTAMP} {re.escape(text)}", line)
+
+
+def test_batched_message_prefixes_every_line_in_connection_view(qapp: object) -> None:
+    panel = LogPanel()
+    panel.add_log("id-a", "first", config_name="alpha")
+    panel._selector.setCurrentIndex(panel._selector.findData("id-a"))
+    panel.add_log("id-a", "[ssh] one\n[ssh] two", config_name="alpha")
+
+    lines = _lines(panel)
+    assert [line.split(" ", 1)[1] for line in lines] == ["first", "[ssh] one", "[ssh] two"]
+    assert all(re.match(_TIMESTAMP, line) for line in lines)
+
+
+def test_filter_rebuild_keeps_per_line_prefixes(qapp: object) -> None:
+    panel = LogPanel()
+    panel.add_log("id-a", "one\ntwo", config_name="alpha")
+    panel._selector.setCurrentIndex(panel._selector.findData("id-a"))
+    panel._selector.setCurrentIndex(panel._selector.findData(""))
+
+    assert all(line.startswith("[alpha] ") for line in _lines(panel))
+    assert len(_lines(panel)) == 2
@@ -0,0 +1,160 @@
+"""Tests for the main window's connection table model and context menu."""
+
+from __future__ import annotations
+
+from unittest.mock import DEFAULT, patch
+
+from PySide6.QtCore import QModelIndex, QPoint
+from PySide6.QtGui import QBrush
+
+from shellshuck.managers.mount import MountManager
+from shellshuck.managers.tunnel import TunnelManager, TunnelProcess, TunnelState
+from shellshuck.models import AppConfig, TunnelConfig
+from shellshuck.widgets.main_window import (
+    COL_NAME,
+    COL_STATUS,
+    HEADERS,
+    STATE_BRUSHES,
+    ConnectionTableModel,
+    MainWindow,
+)
+
+_BRUSH = STATE_BRUSHES["disconnected"]
+
+
+def _row(config_id: str, name: str | None = None) -> tuple[str, str, str, str, str, QBrush]:
+    return (config_id, "tunnel", name or config_id, f"{config_id}.example.com", "Idle", _BRUSH)
+
+
+def _record_signals(model: ConnectionTableModel) -> list[tuple[object, ...]]:
+    """Collect model change notifications in the order they are emitted."""
+    events: list[tuple[object, ...]] = []
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("insert", first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("remove", first, last)))
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    model.dataChanged.connect(
+        lambda top, bottom, roles=(): events.append(
+            ("changed", top.row(), top.column(), bottom.row(), bottom.column())
+        )
+    )
+    return events
+
+
+def _names(model: ConnectionTableModel) -> list[str]:
+    return [model.data(model.index(row, COL_NAME)) for row in range(model.rowCount())]
+
+
+def test_set_rows_populates_model(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a"), _row("b")])
+
+    assert model.rowCount() == 2
+    assert model.columnCount() == len(HEADERS)
+    assert model.rowCount(model.index(0, 0)) == 0
+    assert _names(model) == ["a", "b"]
+    assert model.row_info(1) == ("b", "tunnel")
+    assert model.row_info(2) is None
+
+
+def test_update_rows_inserts_in_the_middle(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a"), _row("c")])
+    events = _record_signals(model)
+
+    model.update_rows([_row("a"), _row("b"), _row("c")])
+
+    assert events == [("insert", 1, 1)]
+    assert _names(model) == ["a", "b", "c"]
+    assert model.row_info(2) == ("c", "tunnel")
+
+
+def test_update_rows_removes_missing_rows(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a"), _row("b"), _row("c")])
+    events = _record_signals(model)
+
+    model.update_rows([_row("a"), _row("c")])
+
+    assert events == [("remove", 1, 1)]
+    assert _names(model) == ["a", "c"]
+    # The id index follows the shifted rows
+    model.set_status("c", "Connected", STATE_BRUSHES["connected"])
+    assert model.data(model.index(1, COL_STATUS)) == "Connected"
+
+
+def test_update_rows_text_change_touches_only_that_row(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a"), _row("b"), _row("c")])
+    events = _record_signals(model)
+
+    model.update_rows([_row("a"), _row("b", name="renamed"), _row("c")])
+
+    assert events == [("changed", 1, 0, 1, len(HEADERS) - 1)]
+    assert _names(model) == ["a", "renamed", "c"]
+
+
+def test_update_rows_unchanged_emits_nothing(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a"), _row("b")])
+    events = _record_signals(model)
+
+    model.update_rows([_row("a"), _row("b")])
+
+    assert events == []
+
+
+def test_update_rows_reorder_resets_model(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a"), _row("b"), _row("c")])
+    events = _record_signals(model)
+
+    model.update_rows([_row("c"), _row("a"), _row("b")])
+
+    assert events == [("reset",)]
+    assert _names(model) == ["c", "a", "b"]
+    assert model.row_info(0) == ("c", "tunnel")
+
+
+def test_set_status_updates_one_cell(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a"), _row("b")])
+    events = _record_signals(model)
+
+    model.set_status("b", "Connected", STATE_BRUSHES["connected"])
+
+    assert events == [("changed", 1, COL_STATUS, 1, COL_STATUS)]
+    assert model.data(model.index(1, COL_STATUS)) == "Connected"
+
+
+def test_set_status_unknown_id_is_ignored(qapp: object) -> None:
+    model = ConnectionTableModel()
+    model.set_rows([_row("a")])
+    events = _record_signals(model)
+
+    model.set_status("missing", "Connected", STATE_BRUSHES["connected"])
+
+    assert events == []
+    assert model.data(model.index(0, COL_STATUS)) == "Idle"
+    assert model.data(QModelIndex()) is None
+
+
+def test_menu_toggle_uses_state_from_when_menu_opened(qapp: object) -> None:
+    tunnel = TunnelConfig(name="db", host="bastion.example.com", user="deploy")
+    tunnel_manager = TunnelManager()
+    tunnel_manager._tunnels[tunnel.id] = TunnelProcess(
+        config=tunnel, state=TunnelState.RECONNECTING
+    )
+    window = MainWindow(AppConfig(tunnels=[tunnel]), tunnel_manager, MountManager())
+    window._table.setCurrentIndex(window._model.index(0, COL_NAME))
+
+    window._show_context_menu(QPoint(0, 0))
+    window._context_menu.hide()
+    assert window._act_toggle.text() == "Disconnect"
+
+    # Retries run out while the menu is open; the click still disconnects
+    tunnel_manager._tunnels[tunnel.id].state = TunnelState.ERROR
+    with patch.multiple(tunnel_manager, start=DEFAULT, stop=DEFAULT) as mocks:
+        window._act_toggle.trigger()
+
+    mocks["stop"].assert_called_once_with(tunnel.id)
+    mocks["start"].assert_not_called()
@@ -48,7 +48,7 @@ def test_tunnel_config_defaults() -> None:
     assert tunnel.extra_ssh_flags == ""
     assert tunnel.connect_on_startup is False
     assert tunnel.identity_file == ""
-    assert tunnel.id  # auto-generated UUID
+    assert tunnel.id  # auto-generated id
 
 
 def test_mount_config_round_trip() -> None:
@@ -161,3 +161,11 @@ def test_mount_config_backward_compat_no_identity_file() -> None:
     }
     mount = MountConfig.from_dict(data)
     assert mount.identity_file == ""
+
+
+def test_from_dict_generates_id_when_missing() -> None:
+    data: dict[str, object] = {"name": "t", "host": "h", "user": "u"}
+    first = TunnelConfig.from_dict(data)
+    second = TunnelConfig.from_dict(data)
+    assert first.id
+    assert first.id != second.id
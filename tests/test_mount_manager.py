@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from pathlib import Path
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
-from shellshuck.managers.mount import (
+from shellshuck.managers._ssh import (
+    BACKOFF_DELAYS_MS,
     BACKOFF_FACTOR,
     INITIAL_RETRY_DELAY_MS,
     MAX_RETRIES,
     MAX_RETRY_DELAY_MS,
+    RETRY_JITTER,
+    STABLE_CONNECTION_S,
+)
+from shellshuck.managers.mount import (
+    MAX_STDERR_BUFFER_BYTES,
     MountManager,
     MountProcess,
     MountState,
     build_sshfs_command,
+    is_mountpoint,
 )
 from shellshuck.models import MountConfig
 
@@ -132,6 +142,18 @@ def test_build_mount_command_without_identity_file() -> None:
     assert "IdentityFile" not in cmd_str
 
 
+def test_is_mountpoint_root() -> None:
+    assert is_mountpoint("/")
+
+
+def test_is_mountpoint_plain_directory(tmp_path: Path) -> None:
+    assert not is_mountpoint(str(tmp_path))
+
+
+def test_is_mountpoint_missing_path(tmp_path: Path) -> None:
+    assert not is_mountpoint(str(tmp_path / "missing"))
+
+
 # ---------------------------------------------------------------------------
 # Backoff delay math
 # ---------------------------------------------------------------------------
@@ -156,13 +178,22 @@ class TestMountBackoffDelay:
         )
         assert delay == MAX_RETRY_DELAY_MS
 
+    def test_delay_table_matches_formula(self) -> None:
+        assert len(BACKOFF_DELAYS_MS) == MAX_RETRIES
+        for attempt, delay in enumerate(BACKOFF_DELAYS_MS):
+            assert delay == min(
+                INITIAL_RETRY_DELAY_MS * (BACKOFF_FACTOR**attempt), MAX_RETRY_DELAY_MS
+            )
+
 
 # ---------------------------------------------------------------------------
 # Reconnect lifecycle
 # ---------------------------------------------------------------------------
 
 
-def _make_mount_config() -> MountConfig:
+@pytest.fixture()
+def mount_config() -> MountConfig:
+    """A fresh config per test, so edits made by one test never leak into another."""
     return MountConfig(
         name="test-mount",
         host="nas.local",
@@ -172,14 +203,21 @@ def _make_mount_config() -> MountConfig:
     )
 
 
+# Stand-in for the QProcess.ExitStatus argument, which _on_finished ignores
+_EXIT_STATUS = MagicMock(name="exit_status")
+
+
 @pytest.fixture()
 def _patch_qt() -> object:  # noqa: PT005
     """Patch QProcess and QTimer so no real processes or timers are created."""
-    with (
-        patch("shellshuck.managers.mount.QProcess", autospec=True) as mock_qprocess_cls,
-        patch("shellshuck.managers.mount.QTimer", autospec=True) as mock_qtimer_cls,
-        patch("shellshuck.managers.mount.QProcessEnvironment", autospec=True),
-    ):
+    with patch.multiple(
+        "shellshuck.managers.mount",
+        QProcess=DEFAULT,
+        QTimer=DEFAULT,
+        autospec=True,
+    ) as mocks:
+        mock_qprocess_cls = mocks["QProcess"]
+        mock_qtimer_cls = mocks["QTimer"]
         mock_proc = MagicMock()
         mock_proc.state.return_value = MagicMock()
         mock_qprocess_cls.return_value = mock_proc
@@ -200,41 +238,50 @@ class TestMountReconnectLifecycle:
     """Integration-style tests for the reconnect flow with patched Qt."""
 
     def test_unexpected_exit_triggers_reconnect(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
     ) -> None:
         mgr = MountManager()
-        config = _make_mount_config()
+        config = mount_config
         mp = MountProcess(config)
         mp.state = MountState.MOUNTED
-        mp.stderr_buffer = "connection lost\n"
+        mp.stderr_buffer = bytearray(b"connection lost\n")
         mgr._mounts[config.id] = mp
 
-        mgr._on_finished(mp, 255, MagicMock())
+        mgr._on_finished(mp, 255, _EXIT_STATUS)
 
         assert mp.state == MountState.RECONNECTING
         assert mp.retry_count == 1
 
     def test_intentional_stop_prevents_reconnect(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
     ) -> None:
         mgr = MountManager()
-        config = _make_mount_config()
+        config = mount_config
         mp = MountProcess(config)
         mp.state = MountState.MOUNTED
         mp.intentional_stop = True
-        mp.stderr_buffer = ""
+        mp.stderr_buffer = bytearray()
         mgr._mounts[config.id] = mp
 
-        mgr._on_finished(mp, 0, MagicMock())
+        mgr._on_finished(mp, 0, _EXIT_STATUS)
 
         assert mp.state == MountState.UNMOUNTED
         assert mp.retry_count == 0
 
     def test_max_retries_triggers_error(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
     ) -> None:
         mgr = MountManager()
-        config = _make_mount_config()
+        config = mount_config
         mp = MountProcess(config)
         mp.state = MountState.RECONNECTING
         mp.retry_count = MAX_RETRIES
@@ -245,11 +292,14 @@ class TestMountReconnectLifecycle:
         assert mp.state == MountState.ERROR
         assert mp.retry_count == MAX_RETRIES
 
-    def test_retry_count_resets_on_success(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+    def test_retry_count_resets_after_stable_connection(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
     ) -> None:
         mgr = MountManager()
-        config = _make_mount_config()
+        config = mount_config
         mp = MountProcess(config)
         mp.state = MountState.RECONNECTING
         mp.retry_count = 5
@@ -257,14 +307,24 @@ class TestMountReconnectLifecycle:
 
         mgr._on_started(mp)
 
-        assert mp.retry_count == 0
+        # Backoff only resets once the connection has proven stable
+        assert mp.retry_count == 5
         assert mp.state == MountState.MOUNTED
+        assert mp.connected_at is not None
+
+        mp.connected_at -= STABLE_CONNECTION_S
+        mgr._on_finished(mp, 255, _EXIT_STATUS)
+
+        assert mp.retry_count == 1
 
     def test_do_reconnect_launches_mount(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
     ) -> None:
         mgr = MountManager()
-        config = _make_mount_config()
+        config = mount_config
         mp = MountProcess(config)
         mp.state = MountState.RECONNECTING
         mp.retry_timer = MagicMock()
@@ -276,11 +336,65 @@ class TestMountReconnectLifecycle:
         assert mp.state == MountState.MOUNTING
         _patch_qt["process_cls"].assert_called()
 
+    def test_mount_all_skips_active_mounts(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+    ) -> None:
+        mgr = MountManager()
+        configs = {
+            state: MountConfig(
+                name=state.name,
+                host="nas.local",
+                user="alice",
+                remote_path="/data",
+                local_mount=f"/mnt/{state.name.lower()}",
+            )
+            for state in MountState
+        }
+        for state, config in configs.items():
+            mp = MountProcess(config)
+            mp.state = state
+            mgr._mounts[config.id] = mp
+
+        with patch.object(mgr, "mount") as mount:
+            mgr.mount_all(configs.values())
+
+        mounted = [call.args[0] for call in mount.call_args_list]
+        assert mounted == [configs[MountState.UNMOUNTED], configs[MountState.ERROR]]
+
+    def test_reconnect_uses_edited_identity_file(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+    ) -> None:
+        mgr = MountManager()
+        config = MountConfig(
+            name="key-mount",
+            host="nas.local",
+            user="alice",
+            remote_path="/data",
+            local_mount="/mnt/data",
+        )
+        mp = MountProcess(config)
+        mp.state = MountState.RECONNECTING
+        mgr._mounts[config.id] = mp
+
+        # "Set up key" edits the config object the running mount already holds
+        config.identity_file = "/home/alice/.ssh/id_ed25519"
+        mgr._do_reconnect(mp)
+
+        (args,), _ = _patch_qt["process"].setArguments.call_args
+        assert "IdentityFile=/home/alice/.ssh/id_ed25519" in args
+
     def test_schedule_reconnect_creates_timer(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
     ) -> None:
         mgr = MountManager()
-        config = _make_mount_config()
+        config = mount_config
         mp = MountProcess(config)
         mp.state = MountState.MOUNTED
         mp.retry_count = 0
@@ -290,4 +404,200 @@ class TestMountReconnectLifecycle:
 
         assert mp.retry_timer is not None
         _patch_qt["timer"].setSingleShot.assert_called_with(True)
-        _patch_qt["timer"].start.assert_called_with(INITIAL_RETRY_DELAY_MS)
+        (delay,), _ = _patch_qt["timer"].start.call_args
+        assert (
+            INITIAL_RETRY_DELAY_MS * (1 - RETRY_JITTER)
+            <= delay
+            <= INITIAL_RETRY_DELAY_MS * (1 + RETRY_JITTER)
+        )
+
+    def test_stderr_lines_batched_into_one_log(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        config = mount_config
+        mp = MountProcess(config)
+        mp.process = MagicMock()
+        mp.process.readAllStandardError.return_value.data.return_value = b"one\ntwo\n"
+        _patch_qt["timer"].isActive.return_value = False
+        mgr._mounts[config.id] = mp
+        logs: list[str] = []
+        mgr.mount_log.connect(lambda cid, msg: logs.append(msg))
+
+        mgr._on_stderr(mp)
+        assert logs == []
+        _patch_qt["timer"].start.assert_called_once()
+
+        mgr._flush_log(mp)
+        assert logs == ["[sshfs] one\n[sshfs] two"]
+        assert mp.pending_log_lines == []
+
+    def test_stderr_dropped_without_log_listeners(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        config = mount_config
+        mp = MountProcess(config)
+        mp.process = MagicMock()
+        mp.process.readAllStandardError.return_value.data.return_value = b"noise\n"
+        mgr._mounts[config.id] = mp
+
+        mgr._on_stderr(mp)
+
+        assert mp.pending_log_lines == []
+        _patch_qt["timer_cls"].assert_not_called()
+
+    def test_health_check_result_marks_unhealthy(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        config = mount_config
+        mp = MountProcess(config)
+        mp.state = MountState.MOUNTED
+        mp.health_check_pending = True
+        mgr._mounts[config.id] = mp
+
+        mgr._on_health_checked(config.id, False)
+
+        assert mp.state == MountState.UNHEALTHY
+        assert mp.health_check_pending is False
+
+        mp.health_check_pending = True
+        mgr._on_health_checked(config.id, True)
+
+        assert mp.state == MountState.MOUNTED
+
+    def test_failed_fusermount_falls_back_to_lazy(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        config = mount_config
+        mp = MountProcess(config)
+        mp.state = MountState.MOUNTED
+        mgr._mounts[config.id] = mp
+
+        mgr.unmount(config.id)
+        _patch_qt["process"].setArguments.assert_called_with(["-u", config.local_mount])
+        # finished(exit_code, exit_status) lands after the bound mp and lazy flag
+        (slot,), _ = _patch_qt["process"].finished.connect.call_args
+        slot(1, _EXIT_STATUS)
+
+        _patch_qt["process"].setArguments.assert_called_with(["-uz", config.local_mount])
+        (slot,), _ = _patch_qt["process"].finished.connect.call_args
+        slot(0, _EXIT_STATUS)
+
+        assert mp.state == MountState.UNMOUNTED
+
+    def test_shutdown_does_not_wait_for_hung_health_check(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        config = mount_config
+        mp = MountProcess(config)
+        mp.state = MountState.MOUNTED
+        mgr._mounts[config.id] = mp
+        release = threading.Event()
+
+        workers: list[threading.Thread] = []
+
+        def hung_stat(path: str) -> bool:
+            release.wait(10)
+            return True
+
+        def spawn(*args: object, **kwargs: object) -> threading.Thread:
+            worker = real_thread(*args, **kwargs)  # type: ignore[arg-type]
+            workers.append(worker)
+            return worker
+
+        real_thread = threading.Thread
+        with (
+            patch("shellshuck.managers.mount.is_mountpoint", hung_stat),
+            patch("shellshuck.managers.mount.threading.Thread", side_effect=spawn),
+        ):
+            mgr._check_health(mp)
+            (worker,) = workers
+            try:
+                # A daemon thread never holds up interpreter or app exit
+                assert worker.daemon
+                started = time.monotonic()
+                mgr.shutdown()
+                assert time.monotonic() - started < 1
+                assert worker.is_alive()
+            finally:
+                release.set()
+                worker.join(5)
+
+    def test_shutdown_blocks_reconnect(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        config = mount_config
+        mp = MountProcess(config)
+        mp.state = MountState.MOUNTED
+        retry_timer = MagicMock()
+        mp.retry_timer = retry_timer
+        mgr._mounts[config.id] = mp
+
+        mgr.shutdown()
+        mgr._schedule_reconnect(mp)
+
+        retry_timer.stop.assert_called_once()
+        assert mp.retry_timer is None
+        assert mp.intentional_stop is True
+        assert mp.retry_count == 0
+        assert mp.state == MountState.MOUNTED
+
+    def test_stderr_buffer_is_bounded(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        mgr.mount_log.connect(lambda cid, msg: None)
+        config = mount_config
+        mp = MountProcess(config)
+        mp.process = MagicMock()
+        mp.process.readAllStandardError.return_value.data.return_value = b"x" * 40000
+        mgr._mounts[config.id] = mp
+
+        for _ in range(5):
+            mgr._on_stderr(mp)
+
+        assert len(mp.stderr_buffer) <= MAX_STDERR_BUFFER_BYTES
+        assert mp.pending_log_lines == []
+
+    def test_set_state_skips_unchanged(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        mount_config: MountConfig,
+    ) -> None:
+        mgr = MountManager()
+        config = mount_config
+        mp = MountProcess(config)
+        mp.state = MountState.MOUNTED
+        emitted: list[object] = []
+        mgr.mount_state_changed.connect(lambda cid, state: emitted.append(state))
+
+        mgr._set_state(mp, MountState.MOUNTED)
+
+        assert emitted == []
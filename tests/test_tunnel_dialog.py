@@ -0,0 +1,148 @@
+"""Tests for the tunnel dialog's forwarding-rule editor."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtWidgets import QSpinBox, QStyleOptionViewItem, QWidget
+
+from shellshuck.models import ForwardRule, TunnelConfig
+from shellshuck.widgets.tunnel_dialog import (
+    PORT_MAX,
+    PORT_MIN,
+    RULE_COL_LOCAL_PORT,
+    RULE_COL_REMOTE_HOST,
+    RULE_COL_REMOTE_PORT,
+    ForwardRulesModel,
+    PortDelegate,
+    TunnelDialog,
+)
+
+
+def _model_with_rule() -> ForwardRulesModel:
+    model = ForwardRulesModel()
+    model.append_rule(ForwardRule(local_port=8080, remote_host="localhost", remote_port=80))
+    return model
+
+
+def test_set_data_accepts_ports_in_range(qapp: object) -> None:
+    model = _model_with_rule()
+
+    assert model.setData(model.index(0, RULE_COL_LOCAL_PORT), PORT_MIN)
+    assert model.setData(model.index(0, RULE_COL_REMOTE_PORT), PORT_MAX)
+
+    assert model.rules() == [ForwardRule(PORT_MIN, "localhost", PORT_MAX)]
+
+
+def test_set_data_rejects_ports_out_of_range(qapp: object) -> None:
+    model = _model_with_rule()
+
+    for col in (RULE_COL_LOCAL_PORT, RULE_COL_REMOTE_PORT):
+        assert not model.setData(model.index(0, col), PORT_MIN - 1)
+        assert not model.setData(model.index(0, col), PORT_MAX + 1)
+        assert not model.setData(model.index(0, col), "not a port")
+
+    assert model.rules() == [ForwardRule(8080, "localhost", 80)]
+
+
+def test_set_data_blank_host_falls_back_to_localhost(qapp: object) -> None:
+    model = _model_with_rule()
+
+    assert model.setData(model.index(0, RULE_COL_REMOTE_HOST), "  db.internal ")
+    assert model.data(model.index(0, RULE_COL_REMOTE_HOST)) == "db.internal"
+    assert model.setData(model.index(0, RULE_COL_REMOTE_HOST), "   ")
+    assert model.data(model.index(0, RULE_COL_REMOTE_HOST)) == "localhost"
+
+
+def test_set_data_ignores_other_roles(qapp: object) -> None:
+    model = _model_with_rule()
+
+    index = model.index(0, RULE_COL_LOCAL_PORT)
+    assert not model.setData(index, 9090, Qt.ItemDataRole.DisplayRole)
+    assert not model.setData(QModelIndex(), 9090)
+    assert model.data(index) == 8080
+
+
+def test_port_delegate_limits_editor_range(qapp: object) -> None:
+    model = _model_with_rule()
+    parent = QWidget()
+
+    editor = PortDelegate().createEditor(
+        parent, QStyleOptionViewItem(), model.index(0, RULE_COL_LOCAL_PORT)
+    )
+
+    assert isinstance(editor, QSpinBox)
+    assert (editor.minimum(), editor.maximum()) == (PORT_MIN, PORT_MAX)
+
+
+def test_append_and_remove_rules(qapp: object) -> None:
+    model = ForwardRulesModel()
+    model.append_rule(ForwardRule(1000, "a", 1))
+    model.append_rule(ForwardRule(2000, "b", 2))
+    model.append_rule(ForwardRule(3000, "c", 3))
+
+    model.remove_rule(1)
+    model.remove_rule(5)  # out of range is a no-op
+    model.remove_rule(-1)  # as is "no current row"
+
+    assert model.rowCount() == 2
+    assert [rule.remote_host for rule in model.rules()] == ["a", "c"]
+
+
+def test_rules_returns_copies(qapp: object) -> None:
+    model = _model_with_rule()
+
+    model.rules()[0].local_port = 1
+
+    assert model.data(model.index(0, RULE_COL_LOCAL_PORT)) == 8080
+
+
+def _tunnel() -> TunnelConfig:
+    return TunnelConfig(
+        name="db",
+        host="bastion.example.com",
+        user="deploy",
+        forward_rules=[ForwardRule(5432, "db.internal", 5432), ForwardRule(6379, "cache", 6379)],
+    )
+
+
+def test_dialog_get_config_returns_edited_rules(qapp: object) -> None:
+    tunnel = _tunnel()
+    dialog = TunnelDialog(tunnel)
+    model = dialog._rules_model
+
+    model.setData(model.index(0, RULE_COL_LOCAL_PORT), 15432)
+    model.remove_rule(1)
+    dialog._add_rule_row(ForwardRule(8080, "web", 80))
+    config = dialog.get_config()
+
+    assert config.id == tunnel.id
+    assert config.forward_rules == [
+        ForwardRule(15432, "db.internal", 5432),
+        ForwardRule(8080, "web", 80),
+    ]
+
+
+def test_dialog_add_rule_button_uses_default_rule(qapp: object) -> None:
+    dialog = TunnelDialog()
+
+    # clicked(bool) passes a checked flag, not a rule
+    dialog._add_rule_row(False)  # type: ignore[arg-type]
+
+    assert dialog.get_config().forward_rules == [ForwardRule(8080, "localhost", 80)]
+
+
+def test_dialog_cancel_leaves_original_rules_untouched(qapp: object) -> None:
+    tunnel = _tunnel()
+    originals = list(tunnel.forward_rules)
+    dialog = TunnelDialog(tunnel)
+    model = dialog._rules_model
+
+    model.setData(model.index(0, RULE_COL_LOCAL_PORT), 15432)
+    model.setData(model.index(1, RULE_COL_REMOTE_HOST), "elsewhere")
+    model.remove_rule(0)
+    dialog.reject()
+
+    assert tunnel.forward_rules == originals
+    assert tunnel.forward_rules[0] is originals[0]
+    assert tunnel.forward_rules[0] == ForwardRule(5432, "db.internal", 5432)
+    assert tunnel.forward_rules[1] == ForwardRule(6379, "cache", 6379)
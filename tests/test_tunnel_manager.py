@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
-from shellshuck.managers.tunnel import (
+from shellshuck.managers._ssh import (
+    BACKOFF_DELAYS_MS,
     BACKOFF_FACTOR,
     INITIAL_RETRY_DELAY_MS,
     MAX_RETRIES,
     MAX_RETRY_DELAY_MS,
+    RETRY_JITTER,
+    STABLE_CONNECTION_S,
+)
+from shellshuck.managers.tunnel import (
     TunnelManager,
     TunnelProcess,
     TunnelState,
@@ -19,6 +24,19 @@ from shellshuck.managers.tunnel import (
 )
 from shellshuck.models import ForwardRule, TunnelConfig
 
+# ssh options in our commands that consume the following argument
+_VALUE_FLAGS = frozenset({"-o", "-p", "-L", "-i"})
+
+
+def _ssh_flag_map(cmd: list[str]) -> dict[str, list[str]]:
+    """Collect the values of each value-taking flag in a single pass over cmd."""
+    flags: dict[str, list[str]] = {}
+    args = iter(cmd)
+    for arg in args:
+        if arg in _VALUE_FLAGS:
+            flags.setdefault(arg, []).append(next(args, ""))
+    return flags
+
 
 def test_build_basic_command() -> None:
     config = TunnelConfig(
@@ -30,9 +48,7 @@ def test_build_basic_command() -> None:
     cmd = build_ssh_command(config)
     assert cmd[0] == "ssh"
     assert "-N" in cmd
-    assert "-L" in cmd
-    idx = cmd.index("-L")
-    assert cmd[idx + 1] == "8080:localhost:80"
+    assert _ssh_flag_map(cmd)["-L"] == ["8080:localhost:80"]
     assert cmd[-1] == "alice@example.com"
 
 
@@ -45,8 +61,7 @@ def test_build_command_custom_port() -> None:
         forward_rules=[ForwardRule(5432, "db.internal", 5432)],
     )
     cmd = build_ssh_command(config)
-    idx = cmd.index("-p")
-    assert cmd[idx + 1] == "2222"
+    assert _ssh_flag_map(cmd)["-p"] == ["2222"]
 
 
 def test_build_command_multiple_forwards() -> None:
@@ -61,12 +76,11 @@ def test_build_command_multiple_forwards() -> None:
         ],
     )
     cmd = build_ssh_command(config)
-    l_indices = [i for i, arg in enumerate(cmd) if arg == "-L"]
-    assert len(l_indices) == 3
-    forwards = [cmd[i + 1] for i in l_indices]
-    assert "5432:db.internal:5432" in forwards
-    assert "6379:redis.internal:6379" in forwards
-    assert "8080:web.internal:80" in forwards
+    assert _ssh_flag_map(cmd)["-L"] == [
+        "5432:db.internal:5432",
+        "6379:redis.internal:6379",
+        "8080:web.internal:80",
+    ]
 
 
 def test_build_command_extra_flags() -> None:
@@ -82,6 +96,17 @@ def test_build_command_extra_flags() -> None:
     assert "-v" in cmd
 
 
+def test_build_command_extra_flags_quoted() -> None:
+    config = TunnelConfig(
+        name="test",
+        host="example.com",
+        user="alice",
+        extra_ssh_flags="-o 'ProxyCommand=ssh -W %h:%p jump'",
+    )
+    cmd = build_ssh_command(config)
+    assert "ProxyCommand=ssh -W %h:%p jump" in cmd
+
+
 def test_build_command_no_forwards() -> None:
     config = TunnelConfig(name="test", host="example.com", user="alice")
     cmd = build_ssh_command(config)
@@ -113,11 +138,31 @@ def test_parse_error_timeout() -> None:
     assert "timed out" in msg.lower()
 
 
+def test_parse_error_case_insensitive() -> None:
+    msg = parse_ssh_error("client_loop: send disconnect: Broken pipe")
+    assert msg == "Connection lost (broken pipe)"
+
+
+def test_parse_error_pattern_priority() -> None:
+    msg = parse_ssh_error("Connection reset by peer\nbind: Address already in use")
+    assert msg == "Local port already in use"
+
+
+def test_parse_error_bytes() -> None:
+    msg = parse_ssh_error(bytearray(b"ssh: connect to host example.com: Connection refused\n"))
+    assert msg == "Connection refused by remote host"
+
+
 def test_parse_error_unknown() -> None:
     msg = parse_ssh_error("some weird error nobody expected\n")
     assert msg == "some weird error nobody expected"
 
 
+def test_parse_error_unknown_uses_last_non_blank_line() -> None:
+    msg = parse_ssh_error("first line\n  last line  \r\n\n   \n")
+    assert msg == "last line"
+
+
 def test_parse_error_empty() -> None:
     msg = parse_ssh_error("")
     assert msg == "Unknown SSH error"
@@ -132,11 +177,9 @@ def test_build_command_with_identity_file() -> None:
         forward_rules=[ForwardRule(8080, "localhost", 80)],
     )
     cmd = build_ssh_command(config)
-    assert "-i" in cmd
-    idx = cmd.index("-i")
-    assert cmd[idx + 1] == "/home/alice/.config/shellshuck/keys/test_ed25519"
-    # -i should appear before user@host
-    assert idx < cmd.index("alice@example.com")
+    assert _ssh_flag_map(cmd)["-i"] == ["/home/alice/.config/shellshuck/keys/test_ed25519"]
+    # -i should appear before user@host, which is always the last argument
+    assert cmd[-1] == "alice@example.com"
 
 
 def test_build_command_without_identity_file() -> None:
@@ -174,13 +217,22 @@ class TestTunnelBackoffDelay:
         )
         assert delay == MAX_RETRY_DELAY_MS
 
+    def test_delay_table_matches_formula(self) -> None:
+        assert len(BACKOFF_DELAYS_MS) == MAX_RETRIES
+        for attempt, delay in enumerate(BACKOFF_DELAYS_MS):
+            assert delay == min(
+                INITIAL_RETRY_DELAY_MS * (BACKOFF_FACTOR**attempt), MAX_RETRY_DELAY_MS
+            )
+
 
 # ---------------------------------------------------------------------------
 # Reconnect lifecycle
 # ---------------------------------------------------------------------------
 
 
-def _make_tunnel_config() -> TunnelConfig:
+@pytest.fixture()
+def tunnel_config() -> TunnelConfig:
+    """A fresh config per test, so edits made by one test never leak into another."""
     return TunnelConfig(
         name="test-tunnel",
         host="example.com",
@@ -189,14 +241,21 @@ def _make_tunnel_config() -> TunnelConfig:
     )
 
 
+# Stand-in for the QProcess.ExitStatus argument, which _on_finished ignores
+_EXIT_STATUS = MagicMock(name="exit_status")
+
+
 @pytest.fixture()
 def _patch_qt() -> object:  # noqa: PT005
     """Patch QProcess and QTimer so no real processes or timers are created."""
-    with (
-        patch("shellshuck.managers.tunnel.QProcess", autospec=True) as mock_qprocess_cls,
-        patch("shellshuck.managers.tunnel.QTimer", autospec=True) as mock_qtimer_cls,
-        patch("shellshuck.managers.tunnel.QProcessEnvironment", autospec=True),
-    ):
+    with patch.multiple(
+        "shellshuck.managers.tunnel",
+        QProcess=DEFAULT,
+        QTimer=DEFAULT,
+        autospec=True,
+    ) as mocks:
+        mock_qprocess_cls = mocks["QProcess"]
+        mock_qtimer_cls = mocks["QTimer"]
         # QProcess instances returned by the constructor
         mock_proc = MagicMock()
         mock_proc.state.return_value = MagicMock()  # ProcessState.NotRunning
@@ -219,42 +278,51 @@ class TestTunnelReconnectLifecycle:
     """Integration-style tests for the reconnect flow with patched Qt."""
 
     def test_unexpected_exit_triggers_reconnect(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
     ) -> None:
         mgr = TunnelManager()
-        config = _make_tunnel_config()
+        config = tunnel_config
         tp = TunnelProcess(config=config, state=TunnelState.CONNECTED)
-        tp.stderr_buffer = "Connection reset by peer\n"
+        tp.stderr_buffer = bytearray(b"Connection reset by peer\n")
         mgr._tunnels[config.id] = tp
 
-        mgr._on_finished(tp, 255, MagicMock())
+        mgr._on_finished(tp, 255, _EXIT_STATUS)
 
         assert tp.state == TunnelState.RECONNECTING
         assert tp.retry_count == 1
 
     def test_intentional_stop_prevents_reconnect(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
     ) -> None:
         mgr = TunnelManager()
-        config = _make_tunnel_config()
+        config = tunnel_config
         tp = TunnelProcess(
             config=config,
             state=TunnelState.CONNECTED,
             intentional_stop=True,
         )
-        tp.stderr_buffer = ""
+        tp.stderr_buffer = bytearray()
         mgr._tunnels[config.id] = tp
 
-        mgr._on_finished(tp, 0, MagicMock())
+        mgr._on_finished(tp, 0, _EXIT_STATUS)
 
         assert tp.state == TunnelState.DISCONNECTED
         assert tp.retry_count == 0
 
     def test_max_retries_triggers_error(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
     ) -> None:
         mgr = TunnelManager()
-        config = _make_tunnel_config()
+        config = tunnel_config
         tp = TunnelProcess(config=config, state=TunnelState.RECONNECTING)
         tp.retry_count = MAX_RETRIES  # already at limit
         mgr._tunnels[config.id] = tp
@@ -265,25 +333,38 @@ class TestTunnelReconnectLifecycle:
         # retry_count should not have been incremented further
         assert tp.retry_count == MAX_RETRIES
 
-    def test_retry_count_resets_on_success(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+    def test_retry_count_resets_after_stable_connection(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
     ) -> None:
         mgr = TunnelManager()
-        config = _make_tunnel_config()
+        config = tunnel_config
         tp = TunnelProcess(config=config, state=TunnelState.RECONNECTING)
         tp.retry_count = 5
         mgr._tunnels[config.id] = tp
 
         mgr._on_started(tp)
 
-        assert tp.retry_count == 0
+        # Backoff only resets once the connection has proven stable
+        assert tp.retry_count == 5
         assert tp.state == TunnelState.CONNECTED
+        assert tp.connected_at is not None
+
+        tp.connected_at -= STABLE_CONNECTION_S
+        mgr._on_finished(tp, 255, _EXIT_STATUS)
+
+        assert tp.retry_count == 1
 
     def test_do_reconnect_launches_tunnel(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
     ) -> None:
         mgr = TunnelManager()
-        config = _make_tunnel_config()
+        config = tunnel_config
         tp = TunnelProcess(config=config, state=TunnelState.RECONNECTING)
         tp.retry_timer = MagicMock()
         mgr._tunnels[config.id] = tp
@@ -295,11 +376,60 @@ class TestTunnelReconnectLifecycle:
         # _launch should have created a new process via QProcess()
         _patch_qt["process_cls"].assert_called()
 
+    def test_start_all_skips_active_tunnels(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+    ) -> None:
+        mgr = TunnelManager()
+        configs = {
+            state: TunnelConfig(name=state.name, host="example.com", user="alice")
+            for state in TunnelState
+        }
+        for state, config in configs.items():
+            mgr._tunnels[config.id] = TunnelProcess(config=config, state=state)
+        fresh = TunnelConfig(name="fresh", host="example.com", user="alice")
+
+        with patch.object(mgr, "start") as start:
+            mgr.start_all([*configs.values(), fresh])
+
+        started = [call.args[0] for call in start.call_args_list]
+        assert started == [
+            configs[TunnelState.DISCONNECTED],
+            configs[TunnelState.ERROR],
+            fresh,
+        ]
+
+    def test_reconnect_uses_edited_identity_file(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+    ) -> None:
+        mgr = TunnelManager()
+        config = TunnelConfig(
+            name="key-tunnel",
+            host="example.com",
+            user="alice",
+            forward_rules=[ForwardRule(8080, "localhost", 80)],
+        )
+        tp = TunnelProcess(config=config, state=TunnelState.RECONNECTING)
+        mgr._tunnels[config.id] = tp
+
+        # "Set up key" edits the config object the running tunnel already holds
+        config.identity_file = "/home/alice/.ssh/id_ed25519"
+        mgr._do_reconnect(tp)
+
+        (args,), _ = _patch_qt["process"].setArguments.call_args
+        assert args[args.index("-i") + 1] == "/home/alice/.ssh/id_ed25519"
+
     def test_schedule_reconnect_creates_timer(
-        self, qapp: object, _patch_qt: dict[str, MagicMock]
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
     ) -> None:
         mgr = TunnelManager()
-        config = _make_tunnel_config()
+        config = tunnel_config
         tp = TunnelProcess(config=config, state=TunnelState.CONNECTED)
         tp.retry_count = 0
         mgr._tunnels[config.id] = tp
@@ -308,4 +438,95 @@ class TestTunnelReconnectLifecycle:
 
         assert tp.retry_timer is not None
         _patch_qt["timer"].setSingleShot.assert_called_with(True)
-        _patch_qt["timer"].start.assert_called_with(INITIAL_RETRY_DELAY_MS)
+        (delay,), _ = _patch_qt["timer"].start.call_args
+        assert (
+            INITIAL_RETRY_DELAY_MS * (1 - RETRY_JITTER)
+            <= delay
+            <= INITIAL_RETRY_DELAY_MS * (1 + RETRY_JITTER)
+        )
+
+    def test_shutdown_blocks_reconnect(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
+    ) -> None:
+        mgr = TunnelManager()
+        config = tunnel_config
+        tp = TunnelProcess(config=config, state=TunnelState.CONNECTED)
+        retry_timer = MagicMock()
+        tp.retry_timer = retry_timer
+        mgr._tunnels[config.id] = tp
+
+        mgr.shutdown()
+        mgr._on_finished(tp, 255, _EXIT_STATUS)
+
+        retry_timer.stop.assert_called_once()
+        assert tp.retry_timer is None
+        assert tp.retry_count == 0
+        assert tp.state == TunnelState.DISCONNECTED
+
+    def test_set_state_skips_unchanged(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
+    ) -> None:
+        mgr = TunnelManager()
+        config = tunnel_config
+        tp = TunnelProcess(config=config, state=TunnelState.CONNECTED)
+        emitted: list[object] = []
+        mgr.tunnel_state_changed.connect(lambda cid, state: emitted.append(state))
+
+        mgr._set_state(tp, TunnelState.CONNECTED)
+
+        assert emitted == []
+
+    def test_stderr_lines_batched_and_kept_for_errors(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
+    ) -> None:
+        mgr = TunnelManager()
+        config = tunnel_config
+        tp = TunnelProcess(config=config, state=TunnelState.CONNECTED)
+        tp.process = MagicMock()
+        mgr._tunnels[config.id] = tp
+        logs: list[str] = []
+        mgr.tunnel_log.connect(lambda cid, msg: logs.append(msg))
+
+        _patch_qt["timer"].isActive.return_value = False
+
+        for chunk in (b"debug1: one\nPermission ", b"denied (publickey).\n"):
+            tp.process.readAllStandardError.return_value.data.return_value = chunk
+            mgr._on_stderr(tp)
+        assert logs == []
+
+        mgr._flush_log(tp)
+
+        assert logs == ["[ssh] debug1: one\n[ssh] Permission denied (publickey)."]
+        assert tp.line_buffer == bytearray()
+        assert parse_ssh_error(tp.stderr_buffer).startswith("Authentication failed")
+
+    def test_stderr_crlf_lines_trimmed(
+        self,
+        qapp: object,
+        _patch_qt: dict[str, MagicMock],
+        tunnel_config: TunnelConfig,
+    ) -> None:
+        mgr = TunnelManager()
+        config = tunnel_config
+        tp = TunnelProcess(config=config, state=TunnelState.CONNECTED)
+        tp.process = MagicMock()
+        mgr._tunnels[config.id] = tp
+        logs: list[str] = []
+        mgr.tunnel_log.connect(lambda cid, msg: logs.append(msg))
+
+        _patch_qt["timer"].isActive.return_value = False
+
+        tp.process.readAllStandardError.return_value.data.return_value = b"one\r\n\r\ntwo\n"
+        mgr._on_stderr(tp)
+        mgr._flush_log(tp)
+
+        assert logs == ["[ssh] one\n[ssh] two"]